@@ -140,9 +140,9 @@ def example_run_query() -> None:
 
         print("\nResults:")
         for row in result.rows:
-            event_type = row.values.get("event_type")
-            event_count = row.values.get("event_count")
-            total_revenue = row.values.get("total_revenue")
+            event_type = row.get("event_type")
+            event_count = row.get("event_count")
+            total_revenue = row.get("total_revenue")
             print(
                 f"  {event_type:15} | Count: {event_count:6} | Revenue: ${total_revenue or 0:.2f}"
             )
@@ -331,10 +331,10 @@ def example_complex_analytics_query() -> None:
         print("✓ Analytics query completed")
         print("\nCustomer Segmentation:")
         for row in result.rows:
-            segment = row.values.get("customer_segment")
-            count = row.values.get("customer_count")
-            revenue = row.values.get("avg_revenue")
-            days = row.values.get("avg_active_days")
+            segment = row.get("customer_segment")
+            count = row.get("customer_count")
+            revenue = row.get("avg_revenue")
+            days = row.get("avg_active_days")
             print(
                 f"  {segment:15} | Customers: {count:4} | Avg Revenue: ${revenue:.2f} | Avg Active Days: {days:.1f}"
             )
@@ -24,7 +24,11 @@ Example:
 
 __version__ = "0.1.0"
 
-from . import config, controllers, exceptions, models, utils
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import config, controllers, exceptions, models, utils
 
 __all__ = [
     "config",
@@ -34,3 +38,16 @@ __all__ = [
     "utils",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import subpackages on first access.
+
+    ``controllers`` pulls in every installed Google Cloud client library, so
+    it is only loaded when asked for; ``import gcp_utils.models`` stays light.
+    """
+    if name in __all__ and name != "__version__":
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,11 +7,11 @@ operations including repository management, image operations, and Docker integra
 
 import json
 import subprocess
-from typing import Any
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
 
 from google.api_core import exceptions as google_exceptions
 from google.auth.credentials import Credentials
-from google.cloud import artifactregistry_v1
 
 from ..config import GCPSettings, get_settings
 from ..exceptions import (
@@ -21,6 +21,17 @@ from ..exceptions import (
 )
 from ..models.artifact_registry import Repository
 
+if TYPE_CHECKING:
+    from google.cloud import artifactregistry_v1
+
+# The generated client pulls in the whole protobuf type tree, so it is imported
+# on first use. Fail here if the extra is missing so gcp_utils.controllers can
+# still detect availability via ImportError.
+if find_spec("google.cloud.artifactregistry_v1") is None:
+    raise ImportError(
+        "google-cloud-artifact-registry is required for ArtifactRegistryController"
+    )
+
 
 class ArtifactRegistryController:
     """
@@ -62,7 +73,7 @@ class ArtifactRegistryController:
         self._credentials = credentials
         self._client: artifactregistry_v1.ArtifactRegistryClient | None = None
 
-    def _get_client(self) -> artifactregistry_v1.ArtifactRegistryClient:
+    def _get_client(self) -> "artifactregistry_v1.ArtifactRegistryClient":
         """
         Get or create Artifact Registry client.
 
@@ -74,6 +85,8 @@ class ArtifactRegistryController:
         """
         if self._client is None:
             try:
+                from google.cloud import artifactregistry_v1
+
                 self._client = artifactregistry_v1.ArtifactRegistryClient(
                     credentials=self._credentials
                 )
@@ -125,6 +138,8 @@ class ArtifactRegistryController:
             )
 
         try:
+            from google.cloud import artifactregistry_v1
+
             client = self._get_client()
 
             parent = f"projects/{self._settings.project_id}/locations/{location}"
@@ -186,6 +201,8 @@ class ArtifactRegistryController:
             >>> repo = registry.get_repository("my-docker-repo", "us-central1")
         """
         try:
+            from google.cloud import artifactregistry_v1
+
             client = self._get_client()
 
             name = (
@@ -235,6 +252,8 @@ class ArtifactRegistryController:
             ...     print(repo["name"])
         """
         try:
+            from google.cloud import artifactregistry_v1
+
             client = self._get_client()
 
             parent = f"projects/{self._settings.project_id}/locations/{location}"
@@ -282,6 +301,8 @@ class ArtifactRegistryController:
             >>> registry.delete_repository("old-repo", "us-central1")
         """
         try:
+            from google.cloud import artifactregistry_v1
+
             client = self._get_client()
 
             name = (
@@ -24,7 +24,6 @@ from ..models.bigquery import (
     DatasetListResponse,
     Job,
     QueryResult,
-    QueryRow,
     SchemaField,
     Table,
     TableListResponse,
@@ -51,7 +50,7 @@ class BigQueryController:
         # Run a query
         result = bq.query("SELECT * FROM `project.dataset.table` LIMIT 10")
         for row in result.rows:
-            print(row.values)
+            print(row)
         ```
     """
 
@@ -562,7 +561,7 @@ class BigQueryController:
             print(f"Bytes processed: {result.total_bytes_processed}")
 
             for row in result.rows:
-                print(f"{row.values['name']}: {row.values['count']}")
+                print(f"{row['name']}: {row['count']}")
             ```
         """
         try:
@@ -582,10 +581,7 @@ class BigQueryController:
             results = query_job.result(max_results=max_results)
 
             # Convert results to QueryResult model
-            rows = []
-            for row in results:
-                row_dict = dict(row.items())
-                rows.append(QueryRow(values=row_dict))
+            rows = [dict(row.items()) for row in results]
 
             # Convert schema
             schema = [
@@ -598,7 +594,9 @@ class BigQueryController:
                 for field in results.schema
             ]
 
-            return QueryResult(
+            # Rows come straight from the BigQuery client; constructing without
+            # validation avoids re-checking and copying every row dict.
+            return QueryResult.model_construct(
                 total_rows=results.total_rows,
                 rows=rows,
                 schema=schema,
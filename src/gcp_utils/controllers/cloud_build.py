@@ -98,7 +98,7 @@ class CloudBuildController:
             start_time=build.start_time,
             finish_time=build.finish_time,
             log_url=build.log_url or None,
-            timeout=str(build.timeout.seconds) + "s" if build.timeout else None,
+            timeout_s=build.timeout.seconds if build.timeout else None,
             steps=[],  # Simplified for now
         )
 
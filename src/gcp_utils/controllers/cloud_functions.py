@@ -5,6 +5,8 @@ This module provides a type-safe controller for deploying and managing
 Cloud Functions (2nd gen) including HTTP functions and event-driven functions.
 """
 
+import sys
+
 from google.api_core.exceptions import GoogleAPIError
 from google.auth.credentials import Credentials
 from google.cloud import functions_v2
@@ -22,8 +24,16 @@ from ..config import GCPSettings, get_settings
 from ..exceptions import CloudFunctionsError, ResourceNotFoundError
 from ..models.cloud_functions import (
     CloudFunction,
+    EventFilter,
+    EventTrigger,
     FunctionListResponse,
+    FunctionState,
     GenerateUploadUrlResponse,
+    IngressSettings,
+    SecretEnvVar,
+    SecretVolume,
+    ServiceConfig,
+    VpcConnectorEgressSettings,
 )
 
 
@@ -93,12 +103,101 @@ class CloudFunctionsController:
             )
         return self._client
 
+    def _service_config_to_model(
+        self, config: functions_v2.ServiceConfig
+    ) -> ServiceConfig:
+        """Convert a ServiceConfig proto, interning the project and account IDs."""
+        # model_construct() skips the InternedStr validators, so intern here.
+        return ServiceConfig.model_construct(
+            available_memory=config.available_memory or None,
+            timeout_seconds=config.timeout_seconds or None,
+            max_instance_count=config.max_instance_count or None,
+            min_instance_count=config.min_instance_count or None,
+            max_instance_request_concurrency=config.max_instance_request_concurrency
+            or None,
+            available_cpu=config.available_cpu or None,
+            environment_variables=dict(config.environment_variables) or None,
+            secret_environment_variables=[
+                SecretEnvVar.model_construct(
+                    key=secret.key,
+                    project_id=sys.intern(secret.project_id),
+                    secret=secret.secret,
+                    version=secret.version or "latest",
+                )
+                for secret in config.secret_environment_variables
+            ]
+            or None,
+            secret_volumes=[
+                SecretVolume.model_construct(
+                    mount_path=volume.mount_path,
+                    project_id=sys.intern(volume.project_id),
+                    secret=volume.secret,
+                    versions=[
+                        {"version": v.version, "path": v.path} for v in volume.versions
+                    ],
+                )
+                for volume in config.secret_volumes
+            ]
+            or None,
+            service_account_email=(
+                sys.intern(config.service_account_email)
+                if config.service_account_email
+                else None
+            ),
+            ingress_settings=(
+                IngressSettings[config.ingress_settings.name]
+                if config.ingress_settings
+                else None
+            ),
+            vpc_connector=config.vpc_connector or None,
+            vpc_connector_egress_settings=(
+                VpcConnectorEgressSettings[config.vpc_connector_egress_settings.name]
+                if config.vpc_connector_egress_settings
+                else None
+            ),
+            all_traffic_on_latest_revision=config.all_traffic_on_latest_revision,
+        )
+
+    def _event_trigger_to_model(
+        self, trigger: functions_v2.EventTrigger
+    ) -> EventTrigger:
+        """Convert an EventTrigger proto, interning the region and account IDs."""
+        return EventTrigger.model_construct(
+            trigger_region=(
+                sys.intern(trigger.trigger_region) if trigger.trigger_region else None
+            ),
+            event_type=trigger.event_type,
+            event_filters=[
+                EventFilter(f.attribute, f.value, f.operator or None)
+                for f in trigger.event_filters
+            ]
+            or None,
+            pubsub_topic=trigger.pubsub_topic or None,
+            service_account_email=(
+                sys.intern(trigger.service_account_email)
+                if trigger.service_account_email
+                else None
+            ),
+            retry_policy=trigger.retry_policy.name if trigger.retry_policy else None,
+            channel=trigger.channel or None,
+        )
+
     def _function_to_model(self, function: Function) -> CloudFunction:
         """Convert a Function proto to CloudFunction model."""
-        return CloudFunction(
+        return CloudFunction.model_construct(
             name=function.name,
             description=function.description or None,
-            state=function.state.name if function.state else None,
+            service_config=(
+                self._service_config_to_model(function.service_config)
+                if function.service_config
+                else None
+            ),
+            event_trigger=(
+                self._event_trigger_to_model(function.event_trigger)
+                if function.event_trigger
+                else None
+            ),
+            state=FunctionState[function.state.name] if function.state else None,
             url=function.service_config.uri if function.service_config else None,
             update_time=function.update_time,
             labels=dict(function.labels) if function.labels else None,
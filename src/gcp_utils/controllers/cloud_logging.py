@@ -5,6 +5,7 @@ This module provides a high-level interface for writing logs, querying log entri
 creating log-based metrics, and managing log sinks for export.
 """
 
+import sys
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -905,10 +906,19 @@ class CloudLoggingController:
         # Extract resource
         resource = {}
         if hasattr(entry, "resource") and entry.resource:
+            # Entries from one query share a few resource types and labels;
+            # intern them so a large page holds one copy of each string.
             resource = {
-                "type": entry.resource.type if hasattr(entry.resource, "type") else "",
+                "type": (
+                    sys.intern(entry.resource.type)
+                    if isinstance(getattr(entry.resource, "type", None), str)
+                    else ""
+                ),
                 "labels": (
-                    dict(entry.resource.labels)
+                    {
+                        sys.intern(k): sys.intern(v) if isinstance(v, str) else v
+                        for k, v in dict(entry.resource.labels).items()
+                    }
                     if hasattr(entry.resource, "labels")
                     else {}
                 ),
@@ -943,7 +953,7 @@ class CloudLoggingController:
                 val = getattr(obj, attr, None)
                 return val if isinstance(val, bool) else None
 
-            http_request = HttpRequestInfo(
+            http_request = HttpRequestInfo.model_construct(
                 request_method=get_str_val(http_req, "request_method"),
                 request_url=get_str_val(http_req, "request_url"),
                 request_size=get_int_val(http_req, "request_size"),
@@ -976,7 +986,7 @@ class CloudLoggingController:
                 val = getattr(obj, attr, None)
                 return val if isinstance(val, int) else None
 
-            source_location = SourceLocation(
+            source_location = SourceLocation.model_construct(
                 file=get_str_val(src_loc, "file"),
                 line=get_int_val(src_loc, "line"),
                 function=get_str_val(src_loc, "function"),
@@ -1021,8 +1031,12 @@ class CloudLoggingController:
                 return val if isinstance(val, bool) else None
             return None
 
-        log_entry = LogEntry(
-            log_name=entry.log_name if hasattr(entry, "log_name") else "",
+        log_entry = LogEntry.model_construct(
+            log_name=(
+                sys.intern(entry.log_name)
+                if isinstance(getattr(entry, "log_name", None), str)
+                else ""
+            ),
             resource=resource,
             timestamp=timestamp_val,
             receive_timestamp=receive_timestamp_val,
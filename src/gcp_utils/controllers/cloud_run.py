@@ -582,7 +582,7 @@ class CloudRunController:
         if hasattr(service, "traffic"):
             for t in service.traffic:
                 traffic.append(
-                    TrafficTarget(
+                    TrafficTarget.model_construct(
                         revision_name=t.revision if hasattr(t, "revision") else None,
                         percent=t.percent if hasattr(t, "percent") else 0,
                         tag=t.tag if hasattr(t, "tag") else None,
@@ -600,7 +600,7 @@ class CloudRunController:
         if hasattr(service, "latest_ready_revision"):
             latest_revision = service.latest_ready_revision
 
-        model = CloudRunService(
+        model = CloudRunService.model_construct(
             name=name,
             region=self.region,
             image=image,
@@ -1183,7 +1183,7 @@ class CloudRunController:
             except ValueError:
                 pass
 
-        model = CloudRunJob(
+        model = CloudRunJob.model_construct(
             name=name,
             region=self.region,
             image=image,
@@ -1277,7 +1277,7 @@ class CloudRunController:
         if hasattr(execution, "log_uri") and failed_count > 0:
             error_message = f"Execution failed with {failed_count} failed task(s)"
 
-        model = JobExecution(
+        model = JobExecution.model_construct(
             name=name,
             execution_id=execution_id,
             job_name=job_name,
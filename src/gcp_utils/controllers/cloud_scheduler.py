@@ -5,6 +5,8 @@ This module provides a type-safe controller for creating and managing
 Cloud Scheduler jobs with HTTP, Pub/Sub, and App Engine targets.
 """
 
+import sys
+
 from google.api_core.exceptions import GoogleAPIError
 from google.auth.credentials import Credentials
 from google.cloud import scheduler_v1
@@ -21,7 +23,7 @@ from google.cloud.scheduler_v1.types import (
 )
 
 from ..config import GCPSettings, get_settings
-from ..exceptions import CloudSchedulerError, ResourceNotFoundError
+from ..exceptions import CloudSchedulerError, ResourceNotFoundError, ValidationError
 from ..models.cloud_scheduler import (
     JobListResponse,
     JobState,
@@ -29,6 +31,7 @@ from ..models.cloud_scheduler import (
     ResumeJobResponse,
     RunJobResponse,
     SchedulerJob,
+    check_cron_schedule,
 )
 
 
@@ -86,12 +89,12 @@ class CloudSchedulerController:
 
     def _job_to_model(self, job: Job) -> SchedulerJob:
         """Convert a Job proto to SchedulerJob model."""
-        return SchedulerJob(
+        return SchedulerJob.model_construct(
             name=job.name,
             description=job.description or None,
             schedule=job.schedule,
-            time_zone=job.time_zone,
-            state=job.state.name if job.state else None,
+            time_zone=sys.intern(job.time_zone),
+            state=JobState[job.state.name] if job.state else None,
             schedule_time=job.schedule_time,
             last_attempt_time=job.last_attempt_time,
             user_update_time=job.user_update_time,
@@ -129,6 +132,7 @@ class CloudSchedulerController:
             SchedulerJob model containing the created job details
 
         Raises:
+            ValidationError: If a unix-cron schedule does not have five fields
             CloudSchedulerError: If job creation fails
 
         Example:
@@ -149,6 +153,11 @@ class CloudSchedulerController:
             )
             ```
         """
+        try:
+            check_cron_schedule(schedule)
+        except ValueError as e:
+            raise ValidationError(str(e), details={"schedule": schedule}) from e
+
         try:
             client = self._get_client()
             region = location or self._settings.cloud_scheduler_location
@@ -466,6 +475,7 @@ class CloudSchedulerController:
             SchedulerJob model with updated job details
 
         Raises:
+            ValidationError: If a unix-cron schedule does not have five fields
             ResourceNotFoundError: If job doesn't exist
             CloudSchedulerError: If update fails
 
@@ -479,6 +489,12 @@ class CloudSchedulerController:
             )
             ```
         """
+        if schedule is not None:
+            try:
+                check_cron_schedule(schedule)
+            except ValueError as e:
+                raise ValidationError(str(e), details={"schedule": schedule}) from e
+
         try:
             client = self._get_client()
             region = location or self._settings.cloud_scheduler_location
@@ -84,7 +84,7 @@ class FirestoreController:
         Returns:
             FirestoreDocument with bound native reference
         """
-        doc_model = FirestoreDocument(
+        doc_model = FirestoreDocument.model_construct(
             id=doc.id,
             collection=collection,
             data=doc.to_dict() or {},
@@ -8,6 +8,8 @@ This module provides a controller for GCP IAM operations including:
 - Listing and querying service accounts
 """
 
+import sys
+
 from google.api_core import exceptions as google_exceptions
 from google.auth.credentials import Credentials
 from google.cloud import iam_admin_v1
@@ -23,11 +25,13 @@ from google.cloud.iam_admin_v1.types import (
 )
 from google.cloud.iam_admin_v1.types import ServiceAccount as GCPServiceAccount
 from google.iam.v1 import iam_policy_pb2, policy_pb2
+from google.type import expr_pb2
 
 from ..config import GCPSettings, get_settings
 from ..exceptions import IAMError, ResourceNotFoundError
 from ..models.iam import (
     IAMBinding,
+    IAMCondition,
     IAMPolicy,
     ServiceAccount,
     ServiceAccountInfo,
@@ -70,6 +74,35 @@ class IAMController:
             self._client = iam_admin_v1.IAMClient(credentials=self._credentials)
         return self._client
 
+    def _account_to_model(self, account: GCPServiceAccount) -> ServiceAccount:
+        """Convert a ServiceAccount proto to ServiceAccount model."""
+        return ServiceAccount.model_construct(
+            name=account.name,
+            project_id=account.project_id,
+            unique_id=account.unique_id,
+            email=account.email,
+            display_name=account.display_name,
+            description=account.description,
+            oauth2_client_id=account.oauth2_client_id,
+            disabled=account.disabled,
+        )
+
+    def _binding_to_model(self, binding: policy_pb2.Binding) -> IAMBinding:
+        """Convert a Binding proto to IAMBinding model."""
+        condition = None
+        if binding.HasField("condition"):
+            condition = IAMCondition.model_construct(
+                expression=binding.condition.expression,
+                title=binding.condition.title or None,
+                description=binding.condition.description or None,
+                location=binding.condition.location or None,
+            )
+        return IAMBinding.model_construct(
+            role=sys.intern(binding.role),
+            members=tuple(binding.members),
+            condition=condition,
+        )
+
     def create_service_account(
         self,
         account_id: str,
@@ -118,16 +151,7 @@ class IAMController:
 
             response = client.create_service_account(request=request)
 
-            return ServiceAccount(
-                name=response.name,
-                project_id=response.project_id,
-                unique_id=response.unique_id,
-                email=response.email,
-                display_name=response.display_name,
-                description=response.description,
-                oauth2_client_id=response.oauth2_client_id,
-                disabled=response.disabled,
-            )
+            return self._account_to_model(response)
 
         except google_exceptions.GoogleAPIError as e:
             raise IAMError(
@@ -163,16 +187,7 @@ class IAMController:
             request = GetServiceAccountRequest(name=name)
             response = client.get_service_account(request=request)
 
-            return ServiceAccount(
-                name=response.name,
-                project_id=response.project_id,
-                unique_id=response.unique_id,
-                email=response.email,
-                display_name=response.display_name,
-                description=response.description,
-                oauth2_client_id=response.oauth2_client_id,
-                disabled=response.disabled,
-            )
+            return self._account_to_model(response)
 
         except google_exceptions.NotFound as e:
             raise ResourceNotFoundError(
@@ -217,18 +232,7 @@ class IAMController:
 
             accounts = []
             for response in client.list_service_accounts(request=request):
-                accounts.append(
-                    ServiceAccount(
-                        name=response.name,
-                        project_id=response.project_id,
-                        unique_id=response.unique_id,
-                        email=response.email,
-                        display_name=response.display_name,
-                        description=response.description,
-                        oauth2_client_id=response.oauth2_client_id,
-                        disabled=response.disabled,
-                    )
-                )
+                accounts.append(self._account_to_model(response))
 
             return accounts
 
@@ -291,16 +295,7 @@ class IAMController:
 
             response = client.patch_service_account(request=request)
 
-            return ServiceAccount(
-                name=response.name,
-                project_id=response.project_id,
-                unique_id=response.unique_id,
-                email=response.email,
-                display_name=response.display_name,
-                description=response.description,
-                oauth2_client_id=response.oauth2_client_id,
-                disabled=response.disabled,
-            )
+            return self._account_to_model(response)
 
         except google_exceptions.GoogleAPIError as e:
             raise IAMError(
@@ -383,13 +378,13 @@ class IAMController:
 
             response = client.create_service_account_key(request=request)
 
-            return ServiceAccountKey(
+            return ServiceAccountKey.model_construct(
                 name=response.name,
                 private_key_type=str(response.private_key_type),
-                key_algorithm=ServiceAccountKeyAlgorithm(
+                key_algorithm=(
                     response.key_algorithm.name
                     if hasattr(response.key_algorithm, "name")
-                    else "KEY_ALG_RSA_2048"
+                    else ServiceAccountKeyAlgorithm.KEY_ALG_RSA_2048.value
                 ),
                 private_key_data=(
                     response.private_key_data.decode("utf-8")
@@ -437,12 +432,12 @@ class IAMController:
             keys = []
             for key in response.keys:
                 keys.append(
-                    ServiceAccountKey(
+                    ServiceAccountKey.model_construct(
                         name=key.name,
-                        key_algorithm=ServiceAccountKeyAlgorithm(
+                        key_algorithm=(
                             key.key_algorithm.name
                             if hasattr(key.key_algorithm, "name")
-                            else "KEY_ALG_RSA_2048"
+                            else ServiceAccountKeyAlgorithm.KEY_ALG_RSA_2048.value
                         ),
                         valid_after_time=key.valid_after_time,
                         valid_before_time=key.valid_before_time,
@@ -516,19 +511,9 @@ class IAMController:
             request = iam_policy_pb2.GetIamPolicyRequest(resource=resource)
             response = client.get_iam_policy(request=request)
 
-            bindings = []
-            for binding in response.bindings:
-                bindings.append(
-                    IAMBinding(
-                        role=binding.role,
-                        members=list(binding.members),
-                        condition=None,  # TODO: Parse condition if exists
-                    )
-                )
-
-            return IAMPolicy(
+            return IAMPolicy.model_construct(
                 version=response.version,
-                bindings=bindings,
+                bindings=[self._binding_to_model(b) for b in response.bindings],
                 etag=response.etag.decode("utf-8") if response.etag else None,
             )
 
@@ -581,6 +566,15 @@ class IAMController:
                     role=binding.role,
                     members=binding.members,
                 )
+                if binding.condition:
+                    proto_binding.condition.CopyFrom(
+                        expr_pb2.Expr(
+                            expression=binding.condition.expression,
+                            title=binding.condition.title or "",
+                            description=binding.condition.description or "",
+                            location=binding.condition.location or "",
+                        )
+                    )
                 bindings.append(proto_binding)
 
             policy_proto = policy_pb2.Policy(
@@ -594,18 +588,9 @@ class IAMController:
             )
             response = client.set_iam_policy(request=request)
 
-            result_bindings = []
-            for binding in response.bindings:
-                result_bindings.append(
-                    IAMBinding(
-                        role=binding.role,
-                        members=list(binding.members),
-                    )
-                )
-
-            return IAMPolicy(
+            return IAMPolicy.model_construct(
                 version=response.version,
-                bindings=result_bindings,
+                bindings=[self._binding_to_model(b) for b in response.bindings],
                 etag=response.etag.decode("utf-8") if response.etag else None,
             )
 
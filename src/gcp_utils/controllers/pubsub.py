@@ -6,6 +6,7 @@ operations including topic and subscription management.
 """
 
 import json
+import sys
 from typing import Any
 
 from google.auth.credentials import Credentials
@@ -570,10 +571,15 @@ class PubSubController:
 
     def _topic_to_model(self, topic: Any) -> TopicInfo:
         """Convert Topic to TopicInfo model with native object binding."""
-        model = TopicInfo(
+        model = TopicInfo.model_construct(
             name=topic.name.split("/")[-1],
             full_name=topic.name,
-            labels=dict(topic.labels) if hasattr(topic, "labels") else {},
+            # Label keys and values repeat across resources; intern them
+            labels=(
+                {sys.intern(k): sys.intern(v) for k, v in topic.labels.items()}
+                if hasattr(topic, "labels")
+                else {}
+            ),
         )
         # Bind the native object
         model._topic_object = topic
@@ -581,7 +587,7 @@ class PubSubController:
 
     def _subscription_to_model(self, subscription: Any) -> SubscriptionInfo:
         """Convert Subscription to SubscriptionInfo model with native object binding."""
-        model = SubscriptionInfo(
+        model = SubscriptionInfo.model_construct(
             name=subscription.name.split("/")[-1],
             full_name=subscription.name,
             topic=subscription.topic if hasattr(subscription, "topic") else None,
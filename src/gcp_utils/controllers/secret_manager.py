@@ -5,6 +5,7 @@ This module provides a high-level interface for Google Cloud Secret Manager
 operations including secret creation, access, and version management.
 """
 
+import sys
 from typing import Any
 
 from google.auth.credentials import Credentials
@@ -498,10 +499,15 @@ class SecretManagerController:
 
     def _secret_to_model(self, secret: Any) -> SecretInfo:
         """Convert Secret to SecretInfo model with native object binding."""
-        model = SecretInfo(
+        model = SecretInfo.model_construct(
             name=secret.name.split("/")[-1],
             full_name=secret.name,
-            labels=dict(secret.labels) if hasattr(secret, "labels") else {},
+            # Label keys and values repeat across resources; intern them
+            labels=(
+                {sys.intern(k): sys.intern(v) for k, v in secret.labels.items()}
+                if hasattr(secret, "labels")
+                else {}
+            ),
             created=secret.create_time if hasattr(secret, "create_time") else None,
         )
         # Bind the native object
@@ -512,10 +518,10 @@ class SecretManagerController:
         """Convert SecretVersion to SecretVersionInfo model with native object binding."""
         version_id = version.name.split("/")[-1]
 
-        model = SecretVersionInfo(
+        model = SecretVersionInfo.model_construct(
             name=version_id,
             full_name=version.name,
-            state=str(version.state) if hasattr(version, "state") else "UNKNOWN",
+            state=version.state.name if hasattr(version, "state") else "UNKNOWN",
             created=version.create_time if hasattr(version, "create_time") else None,
             destroyed=(
                 version.destroy_time if hasattr(version, "destroy_time") else None
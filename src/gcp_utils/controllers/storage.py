@@ -15,7 +15,12 @@ from google.cloud.storage import Blob, Bucket
 
 from ..config import GCPSettings, get_settings
 from ..exceptions import ResourceNotFoundError, StorageError, ValidationError
-from ..models.storage import BlobMetadata, BucketInfo, UploadResult
+from ..models.storage import (
+    BlobMetadata,
+    BucketInfo,
+    UploadResult,
+    _delete_blobs_in_batches,
+)
 
 
 class CloudStorageController:
@@ -201,9 +206,7 @@ class CloudStorageController:
 
             if force:
                 # Delete all blobs first
-                blobs = bucket.list_blobs()
-                for blob in blobs:
-                    blob.delete()
+                _delete_blobs_in_batches(self.client, bucket.list_blobs())
 
             bucket.delete()
 
@@ -10,6 +10,7 @@ from .artifact_registry import (
 from .bigquery import (
     Dataset,
     FieldType,
+    FlatSchema,
     Job,
 )
 from .bigquery import JobState as BigQueryJobState
@@ -78,6 +79,7 @@ from .firebase_hosting import (
 from .firestore import FirestoreDocument, FirestoreQuery, QueryOperator
 from .iam import (
     IAMBinding,
+    IAMCondition,
     IAMPolicy,
     ServiceAccount,
     ServiceAccountInfo,
@@ -158,6 +160,7 @@ __all__ = [
     "ServiceAccountKeyAlgorithm",
     "ServiceAccountKeyType",
     "IAMBinding",
+    "IAMCondition",
     "IAMPolicy",
     "ServiceAccountInfo",
     # Cloud Functions models
@@ -180,6 +183,7 @@ __all__ = [
     "QueryResult",
     "Job",
     "SchemaField",
+    "FlatSchema",
     "FieldType",
     "BigQueryJobState",
     # Cloud Build models
@@ -0,0 +1,87 @@
+"""Shared base classes and types for the model modules."""
+
+import re
+import sys
+from datetime import datetime
+from decimal import Decimal
+from functools import cache
+from typing import Annotated
+
+from pydantic import AfterValidator, BaseModel, PlainSerializer
+
+# A string that repeats across most instances of a list response (log names,
+# regions, service accounts); validated values share one interned object.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
+# A datetime dumped as an ISO 8601 string in both python and JSON modes, as the
+# per-model serialize_dt methods it replaced did. pydantic-core's native
+# serializer only does this in JSON mode; model_dump() would return datetime
+# objects. The serializer is the C-level datetime.isoformat, so each value
+# costs one call but no Python frame. Artifact Registry models are the one
+# exception: they use plain datetime fields.
+IsoDateTime = Annotated[
+    datetime,
+    PlainSerializer(datetime.isoformat, return_type=str, when_used="unless-none"),
+]
+
+# Kubernetes-style quantity suffixes, as accepted by Cloud Run and Cloud Functions
+_MEMORY_UNITS = {
+    "": 1,
+    "k": 10**3,
+    "M": 10**6,
+    "G": 10**9,
+    "T": 10**12,
+    "Ki": 2**10,
+    "Mi": 2**20,
+    "Gi": 2**30,
+    "Ti": 2**40,
+}
+_QUANTITY_RE = re.compile(r"(\d+(?:\.\d+)?|\.\d+)([A-Za-z]*)")
+
+
+@cache
+def parse_memory_bytes(value: str) -> int:
+    """
+    Convert a memory quantity such as ``"512Mi"`` or ``"256M"`` to bytes.
+
+    Results are cached per distinct string, so the handful of sizes shared by
+    a whole list of services or functions is parsed once per process.
+
+    Raises:
+        ValueError: If the quantity or its unit is not recognised
+    """
+    match = _QUANTITY_RE.fullmatch(value.strip())
+    if match is None or match.group(2) not in _MEMORY_UNITS:
+        raise ValueError(f"Invalid memory quantity: {value!r}")
+    return int(Decimal(match.group(1)) * _MEMORY_UNITS[match.group(2)])
+
+
+@cache
+def parse_cpu_millicores(value: str) -> int:
+    """
+    Convert a CPU quantity such as ``"1000m"``, ``"2"`` or ``"0.5"`` to millicores.
+
+    Raises:
+        ValueError: If the quantity or its unit is not recognised
+    """
+    match = _QUANTITY_RE.fullmatch(value.strip())
+    if match is None or match.group(2) not in ("", "m"):
+        raise ValueError(f"Invalid CPU quantity: {value!r}")
+    amount = Decimal(match.group(1))
+    return int(amount if match.group(2) == "m" else amount * 1000)
+
+
+class JSONBytesModel(BaseModel):
+    """Base for models that are commonly written straight to the wire."""
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize to compact JSON bytes using field aliases and omitting ``None``.
+
+        Unlike ``model_dump_json()``, the encoder output is returned as-is
+        rather than decoded to ``str`` (and typically re-encoded by the caller).
+        """
+        return self.__pydantic_serializer__.to_json(
+            self, by_alias=True, exclude_none=True
+        )
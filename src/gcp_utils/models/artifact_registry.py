@@ -2,9 +2,9 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_serializer
+from pydantic import BaseModel, Field, PrivateAttr
 
 if TYPE_CHECKING:
     from google.cloud.artifactregistry_v1 import Repository as GCPRepository
@@ -35,7 +35,7 @@ class Repository(BaseModel):
         >>> repo = registry.create_repository("my-app", "us-central1", "DOCKER")
         >>>
         >>> # Use Pydantic fields
-        >>> print(f"Format: {repo.format}")
+        >>> print(f"Format: {repo.format.value}")
         >>>
         >>> # Use convenience methods
         >>> repo.delete()
@@ -53,12 +53,6 @@ class Repository(BaseModel):
     # The actual Repository object (private attribute, not serialized)
     _repository_object: Optional["GCPRepository"] = PrivateAttr(default=None)
 
-    model_config = ConfigDict(use_enum_values=True, arbitrary_types_allowed=True)
-
-    @field_serializer("create_time", "update_time")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-        return dt.isoformat() if dt else None
-
     # Convenience methods that delegate to controller operations
 
     def delete(self) -> None:
@@ -104,12 +98,6 @@ class DockerImage(BaseModel):
     # The actual DockerImage object (private attribute, not serialized)
     _image_object: Optional["GCPDockerImage"] = PrivateAttr(default=None)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
-    @field_serializer("upload_time")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-        return dt.isoformat() if dt else None
-
     # Convenience methods that delegate to controller operations
 
     def delete(self) -> None:
@@ -138,8 +126,6 @@ class BuildResult(BaseModel):
     build_time: float | None = Field(None, description="Build time in seconds")
     size_bytes: int | None = Field(None, description="Image size in bytes")
 
-    model_config = ConfigDict(use_enum_values=True)
-
 
 class DeploymentPipeline(BaseModel):
     """Complete build-push-deploy pipeline result."""
@@ -151,5 +137,3 @@ class DeploymentPipeline(BaseModel):
     push_success: bool = Field(..., description="Whether push succeeded")
     deploy_success: bool = Field(..., description="Whether deployment succeeded")
     total_time: float | None = Field(None, description="Total pipeline time in seconds")
-
-    model_config = ConfigDict(use_enum_values=True)
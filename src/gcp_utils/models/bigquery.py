@@ -5,11 +5,44 @@ This module provides type-safe models for BigQuery resources including
 datasets, tables, schemas, query results, and job configurations.
 """
 
+from array import array
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from functools import cached_property
+from typing import Any, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from ._common import JSONBytesModel
+
+# Resource and list-response models are read-only snapshots of API responses.
+_RESPONSE_CONFIG = ConfigDict(frozen=True, extra="ignore", revalidate_instances="never")
+
+
+class _CachedJSONBytesModel(JSONBytesModel):
+    """
+    Base for frozen models whose JSON encoding is computed once per instance.
+
+    Fields cannot be reassigned on frozen models, so the cached bytes stay valid
+    unless a nested container (e.g. ``labels``) is mutated in place.
+    """
+
+    @cached_property
+    def _json_bytes(self) -> bytes:
+        return super().to_json_bytes()
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact JSON bytes, reusing the encoding after first use."""
+        return self._json_bytes
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("_json_bytes", None)
+        return copied
 
 
 class DatasetAccess(BaseModel):
@@ -30,9 +63,11 @@ class DatasetAccess(BaseModel):
     )
 
 
-class Dataset(BaseModel):
+class Dataset(_CachedJSONBytesModel):
     """BigQuery dataset model."""
 
+    model_config = _RESPONSE_CONFIG
+
     dataset_id: str = Field(..., description="Dataset ID")
     project: str = Field(..., description="Project ID")
     location: str = Field(default="US", description="Dataset location")
@@ -85,6 +120,8 @@ class FieldType(str, Enum):
 class SchemaField(BaseModel):
     """BigQuery table schema field."""
 
+    model_config = _RESPONSE_CONFIG
+
     name: str = Field(..., description="Field name")
     field_type: str = Field(..., description="Field type (e.g., 'STRING', 'INTEGER')")
     mode: str = Field(
@@ -96,6 +133,86 @@ class SchemaField(BaseModel):
     )
 
 
+class FlatSchema(BaseModel):
+    """
+    Table schema flattened into parallel columns.
+
+    Fields are stored in depth-first pre-order; ``parent_idx[i]`` is the index
+    of field ``i``'s enclosing RECORD/STRUCT, or -1 for top-level fields. Bulk
+    traversals become a single loop over ``range(len(names))`` instead of
+    recursing through nested ``SchemaField`` models.
+    """
+
+    model_config = _RESPONSE_CONFIG
+
+    names: list[str] = Field(default_factory=list, description="Field names")
+    types: list[str] = Field(
+        default_factory=list, description="Field types (e.g., 'STRING', 'RECORD')"
+    )
+    modes: list[str] = Field(
+        default_factory=list, description="Field modes (NULLABLE, REQUIRED, REPEATED)"
+    )
+    descriptions: list[str | None] = Field(
+        default_factory=list, description="Field descriptions"
+    )
+    parent_idx: list[int] = Field(
+        default_factory=list,
+        description="Index of each field's parent, or -1 for top-level fields",
+    )
+
+    @classmethod
+    def from_tree(cls, schema: list[SchemaField]) -> "FlatSchema":
+        """Flatten a nested schema without recursion."""
+        names: list[str] = []
+        types: list[str] = []
+        modes: list[str] = []
+        descriptions: list[str | None] = []
+        parent_idx: list[int] = []
+
+        stack = [(field, -1) for field in reversed(schema)]
+        while stack:
+            field, parent = stack.pop()
+            index = len(names)
+            names.append(field.name)
+            types.append(field.field_type)
+            modes.append(field.mode)
+            descriptions.append(field.description)
+            parent_idx.append(parent)
+            if field.fields:
+                stack.extend((child, index) for child in reversed(field.fields))
+
+        return cls.model_construct(
+            names=names,
+            types=types,
+            modes=modes,
+            descriptions=descriptions,
+            parent_idx=parent_idx,
+        )
+
+    def to_tree(self) -> list[SchemaField]:
+        """Rebuild the nested ``SchemaField`` list without recursion."""
+        children: list[list[SchemaField]] = [[] for _ in self.names]
+        roots: list[SchemaField] = []
+
+        # Pre-order puts every child after its parent, so walking backwards
+        # builds each RECORD only after all of its fields are built.
+        for index in range(len(self.names) - 1, -1, -1):
+            nested = children[index]
+            nested.reverse()
+            field = SchemaField(
+                name=self.names[index],
+                field_type=self.types[index],
+                mode=self.modes[index],
+                description=self.descriptions[index],
+                fields=nested or None,
+            )
+            parent = self.parent_idx[index]
+            (roots if parent < 0 else children[parent]).append(field)
+
+        roots.reverse()
+        return roots
+
+
 class TableType(str, Enum):
     """BigQuery table type."""
 
@@ -118,6 +235,8 @@ class TimePartitioningType(str, Enum):
 class TimePartitioning(BaseModel):
     """Time partitioning configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     type_: TimePartitioningType = Field(
         ..., description="Partitioning type", alias="type"
     )
@@ -135,13 +254,15 @@ class TimePartitioning(BaseModel):
 class Clustering(BaseModel):
     """Table clustering configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     fields: list[str] = Field(..., description="Fields to cluster by (max 4)")
 
 
-class Table(BaseModel):
+class Table(_CachedJSONBytesModel):
     """BigQuery table model."""
 
-    model_config = {"protected_namespaces": ()}
+    model_config = ConfigDict(**_RESPONSE_CONFIG, protected_namespaces=())
 
     table_id: str = Field(..., description="Table ID")
     dataset_id: str = Field(..., description="Dataset ID")
@@ -150,7 +271,7 @@ class Table(BaseModel):
     friendly_name: str | None = Field(default=None, description="Table friendly name")
     labels: dict[str, str] | None = Field(default=None, description="Table labels")
     table_schema: list[SchemaField] | None = Field(
-        default=None, description="Table schema", alias="schema"
+        default=None, alias="schema", description="Table schema"
     )
     num_rows: int | None = Field(default=None, description="Number of rows")
     num_bytes: int | None = Field(default=None, description="Size in bytes")
@@ -227,9 +348,11 @@ class DestinationFormat(str, Enum):
     PARQUET = "PARQUET"
 
 
-class Job(BaseModel):
+class Job(_CachedJSONBytesModel):
     """BigQuery job model."""
 
+    model_config = _RESPONSE_CONFIG
+
     job_id: str = Field(..., description="Job ID")
     project: str = Field(..., description="Project ID")
     location: str = Field(default="US", description="Job location")
@@ -249,21 +372,17 @@ class Job(BaseModel):
     )
 
 
-class QueryRow(BaseModel):
-    """Single row from a query result."""
-
-    values: dict[str, Any] = Field(..., description="Column name to value mapping")
-
-
-class QueryResult(BaseModel):
+class QueryResult(JSONBytesModel):
     """BigQuery query result model."""
 
     model_config = {"protected_namespaces": ()}
 
     total_rows: int = Field(..., description="Total number of rows")
-    rows: list[QueryRow] = Field(default_factory=list, description="Query result rows")
+    rows: list[dict[str, Any]] = Field(
+        default_factory=list, description="Query result rows (column name to value)"
+    )
     result_schema: list[SchemaField] = Field(
-        ..., description="Result schema", alias="schema"
+        alias="schema", description="Result schema"
     )
     job_id: str | None = Field(default=None, description="Job ID for the query")
     total_bytes_processed: int | None = Field(
@@ -277,9 +396,11 @@ class QueryResult(BaseModel):
     )
 
 
-class DatasetListResponse(BaseModel):
+class DatasetListResponse(_CachedJSONBytesModel):
     """Response model for listing datasets."""
 
+    model_config = _RESPONSE_CONFIG
+
     datasets: list[Dataset] = Field(
         default_factory=list, description="List of datasets"
     )
@@ -288,23 +409,91 @@ class DatasetListResponse(BaseModel):
     )
 
 
-class TableListResponse(BaseModel):
+class TableListResponse(_CachedJSONBytesModel):
     """Response model for listing tables."""
 
+    model_config = _RESPONSE_CONFIG
+
     tables: list[Table] = Field(default_factory=list, description="List of tables")
     next_page_token: str | None = Field(
         default=None, description="Token for fetching the next page"
     )
 
 
-class JobListResponse(BaseModel):
+# Stable small-integer codes for the enums packed into JobArrays columns.
+JOB_STATE_CODES: dict[JobState, int] = {state: i for i, state in enumerate(JobState)}
+JOB_TYPE_CODES: dict[JobType, int] = {job_type: i for i, job_type in enumerate(JobType)}
+
+
+@dataclass(slots=True, frozen=True)
+class JobArrays:
+    """
+    Column-oriented view of a job listing for bulk filtering.
+
+    Each column holds one entry per job, in listing order. Enum columns hold
+    codes from ``JOB_STATE_CODES`` / ``JOB_TYPE_CODES`` (``-1`` when unset) and
+    byte counters hold ``0`` when unset.
+
+    Example:
+        >>> arrays = response.as_arrays()
+        >>> done = JOB_STATE_CODES[JobState.DONE]
+        >>> billed = [
+        ...     job_id
+        ...     for job_id, state, billed in zip(
+        ...         arrays.job_ids, arrays.states, arrays.total_bytes_billed
+        ...     )
+        ...     if state == done and billed > 0
+        ... ]
+    """
+
+    job_ids: list[str]
+    """Job IDs"""
+    states: array[int]
+    """Job state codes (typecode ``b``)"""
+    job_types: array[int]
+    """Job type codes (typecode ``b``)"""
+    total_bytes_processed: array[int]
+    """Total bytes processed (typecode ``q``)"""
+    total_bytes_billed: array[int]
+    """Total bytes billed (typecode ``q``)"""
+
+
+class JobListResponse(_CachedJSONBytesModel):
     """Response model for listing jobs."""
 
+    model_config = _RESPONSE_CONFIG
+
     jobs: list[Job] = Field(default_factory=list, description="List of jobs")
     next_page_token: str | None = Field(
         default=None, description="Token for fetching the next page"
     )
 
+    def as_arrays(self) -> JobArrays:
+        """Return the jobs as parallel typed arrays (see ``JobArrays``)."""
+        jobs = self.jobs
+        state_codes = JOB_STATE_CODES
+        type_codes = JOB_TYPE_CODES
+        return JobArrays(
+            job_ids=[job.job_id for job in jobs],
+            states=array(
+                "b",
+                [-1 if job.state is None else state_codes[job.state] for job in jobs],
+            ),
+            job_types=array(
+                "b",
+                [
+                    -1 if job.job_type is None else type_codes[job.job_type]
+                    for job in jobs
+                ],
+            ),
+            total_bytes_processed=array(
+                "q", [job.total_bytes_processed or 0 for job in jobs]
+            ),
+            total_bytes_billed=array(
+                "q", [job.total_bytes_billed or 0 for job in jobs]
+            ),
+        )
+
 
 class LoadJobConfig(BaseModel):
     """Configuration for a load job."""
@@ -322,8 +511,8 @@ class LoadJobConfig(BaseModel):
     )
     load_schema: list[SchemaField] | None = Field(
         default=None,
-        description="Table schema (required if table doesn't exist)",
         alias="schema",
+        description="Table schema (required if table doesn't exist)",
     )
     skip_leading_rows: int | None = Field(
         default=None, description="Number of rows to skip (CSV only)"
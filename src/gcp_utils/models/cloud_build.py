@@ -5,11 +5,226 @@ This module provides type-safe models for Cloud Build resources including
 builds, build triggers, build steps, and source configurations.
 """
 
+import json
+from collections.abc import Callable, Mapping
+from copy import deepcopy
 from datetime import datetime
 from enum import Enum
-from typing import Any
-
-from pydantic import BaseModel, Field
+from functools import cache, cached_property
+from types import UnionType
+from typing import Annotated, Any, Final, Literal, Self, Union, get_args, get_origin
+
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    computed_field,
+)
+from pydantic.alias_generators import to_camel
+from pydantic.json_schema import (
+    DEFAULT_REF_TEMPLATE,
+    GenerateJsonSchema,
+    JsonSchemaMode,
+)
+
+from ._common import JSONBytesModel
+
+# Generated JSON schemas, keyed by model and model_json_schema() arguments.
+_json_schema_cache: dict[tuple[Any, ...], dict[str, Any]] = {}
+
+
+class _BaseModel(JSONBytesModel):
+    """Base for Cloud Build models; schemas are built on first use, not at import."""
+
+    model_config = ConfigDict(
+        defer_build=True,
+        alias_generator=to_camel,
+        validate_by_name=True,
+    )
+
+    @classmethod
+    def model_json_schema(
+        cls,
+        by_alias: bool = True,
+        ref_template: str = DEFAULT_REF_TEMPLATE,
+        schema_generator: type[GenerateJsonSchema] = GenerateJsonSchema,
+        mode: JsonSchemaMode = "validation",
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Generate the JSON schema once per argument set and return a copy.
+
+        Walking the nested Build graph is expensive and the result never changes,
+        so repeated calls (e.g. from an OpenAPI layer) only pay for the copy.
+        """
+        key = (cls, by_alias, ref_template, schema_generator, mode, *kwargs.items())
+        schema = _json_schema_cache.get(key)
+        if schema is None:
+            schema = super().model_json_schema(
+                by_alias, ref_template, schema_generator, mode, **kwargs
+            )
+            _json_schema_cache[key] = schema
+        return deepcopy(schema)
+
+
+class _FrozenModel(_BaseModel):
+    """
+    Base for immutable, hashable Cloud Build resources.
+
+    The generated frozen ``__hash__`` fails on list and dict fields, so the hash
+    is taken over the JSON encoding instead and computed once per instance.
+    Keys are sorted first, so equal models with differently ordered dicts
+    (e.g. ``substitutions``) hash the same.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    @cached_property
+    def _hash(self) -> int:
+        return hash(json.dumps(self.model_dump(mode="json"), sort_keys=True))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def clone(self, **changes: Any) -> Self:
+        """Return a copy with the given fields replaced (not re-validated)."""
+        return self.model_copy(update=changes)
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("_hash", None)
+        return copied
+
+
+_NestedKind = Literal["model", "list", "dict"]
+_UNIONS = (Union, UnionType)
+
+
+@cache
+def _nested_fields(
+    model: type[BaseModel],
+) -> tuple[tuple[str, str | None, _NestedKind, type[BaseModel]], ...]:
+    """Return (name, alias, kind, submodel) for each field holding nested models."""
+    nested = []
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if isinstance(annotation, UnionType):
+            args = [arg for arg in get_args(annotation) if arg is not type(None)]
+            if len(args) != 1:
+                continue
+            annotation = args[0]
+        kind: _NestedKind = "model"
+        if get_origin(annotation) is list:
+            kind, annotation = "list", get_args(annotation)[0]
+        elif get_origin(annotation) is dict:
+            kind, annotation = "dict", get_args(annotation)[1]
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            nested.append((name, field.alias, kind, annotation))
+    return tuple(nested)
+
+
+def _parse_datetime(value: Any) -> Any:
+    """Parse an RFC 3339 timestamp string (``"...Z"`` included) into a datetime."""
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _parse_enum(enum: type[Enum]) -> Callable[[Any], Any]:
+    def parse(value: Any) -> Any:
+        return enum(value) if isinstance(value, str) else value
+
+    return parse
+
+
+@cache
+def _scalar_parsers(
+    model: type[BaseModel],
+) -> tuple[tuple[str, Callable[[Any], Any]], ...]:
+    """
+    Return (input key, parser) for each field ``model_construct()`` would leave raw.
+
+    Durations, datetimes and enums arrive as strings in API payloads; every
+    name and alias of such a field is listed so either naming style is parsed.
+    """
+    parsers: dict[str, Callable[[Any], Any]] = {}
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        args = get_args(annotation) if get_origin(annotation) in _UNIONS else ()
+        parser: Callable[[Any], Any]
+        if DurationSeconds in (annotation, *args):
+            parser = _parse_duration
+        else:
+            types = [arg for arg in args if arg is not type(None)] or [annotation]
+            if len(types) != 1 or not isinstance(types[0], type):
+                continue
+            if issubclass(types[0], datetime):
+                parser = _parse_datetime
+            elif issubclass(types[0], Enum):
+                parser = _parse_enum(types[0])
+            else:
+                continue
+        keys = [name]
+        for alias in (field.alias, field.validation_alias):
+            if isinstance(alias, AliasChoices):
+                keys.extend(c for c in alias.choices if isinstance(c, str))
+            elif isinstance(alias, str):
+                keys.append(alias)
+        parsers.update(dict.fromkeys(keys, parser))
+    return tuple(parsers.items())
+
+
+def _construct[M: BaseModel](model: type[M], data: Mapping[str, Any]) -> M:
+    """Recursively ``model_construct()`` a model and its nested models from a dict."""
+    values = dict(data)
+    for key, parse in _scalar_parsers(model):
+        if key in values:
+            values[key] = parse(values[key])
+    for name, alias, kind, submodel in _nested_fields(model):
+        key = alias if alias is not None and alias in values else name
+        value = values.get(key)
+        if not value or isinstance(value, BaseModel):
+            continue
+        if kind == "model":
+            values[key] = _construct(submodel, value)
+        elif kind == "list":
+            values[key] = [
+                item if isinstance(item, submodel) else _construct(submodel, item)
+                for item in value
+            ]
+        else:
+            values[key] = {
+                k: item if isinstance(item, submodel) else _construct(submodel, item)
+                for k, item in value.items()
+            }
+    return model.model_construct(**values)
+
+
+def _parse_duration(value: Any) -> Any:
+    """Parse a protobuf JSON duration such as ``"600s"`` into whole seconds."""
+    if isinstance(value, str):
+        if not value.endswith("s"):
+            raise ValueError(f"Duration must be in seconds (e.g. '600s'): {value!r}")
+        return int(value[:-1])
+    return value
+
+
+def _format_duration(seconds: int | None) -> str | None:
+    return None if seconds is None else f"{seconds}s"
+
+
+# Durations are stored as int seconds, parsed once from "600s"-style strings.
+DurationSeconds = Annotated[int, BeforeValidator(_parse_duration)]
+
+# Seconds fields also accept the API's duration field (also emitted as a
+# computed field), so dumps in either naming style validate back.
+_TIMEOUT_ALIASES = AliasChoices("timeout_s", "timeoutSeconds", "timeout")
+_QUEUE_TTL_ALIASES = AliasChoices(
+    "queue_ttl_s", "queueTtlSeconds", "queue_ttl", "queueTtl"
+)
 
 
 class BuildStatus(str, Enum):
@@ -27,44 +242,91 @@ class BuildStatus(str, Enum):
     EXPIRED = "EXPIRED"
 
 
-class SubstitutionOption(str, Enum):
-    """Substitution option for build configurations."""
+# Closed option sets that are only passed through to the API are plain string
+# literals; BuildStatus stays an Enum because callers compare against it. Each
+# set keeps a namespace class of the same name, so ``MachineType.E2_MEDIUM``
+# still works as a typed constant.
+
+SubstitutionOptionT = Literal["MUST_MATCH", "ALLOW_LOOSE"]
+"""Substitution option for build configurations."""
+
+
+class SubstitutionOption:
+    """Named ``SubstitutionOptionT`` values."""
+
+    MUST_MATCH: Final[SubstitutionOptionT] = "MUST_MATCH"
+    ALLOW_LOOSE: Final[SubstitutionOptionT] = "ALLOW_LOOSE"
+
+
+LogStreamingOptionT = Literal["STREAM_DEFAULT", "STREAM_ON", "STREAM_OFF"]
+"""Log streaming option."""
+
 
-    MUST_MATCH = "MUST_MATCH"
-    ALLOW_LOOSE = "ALLOW_LOOSE"
+class LogStreamingOption:
+    """Named ``LogStreamingOptionT`` values."""
 
+    STREAM_DEFAULT: Final[LogStreamingOptionT] = "STREAM_DEFAULT"
+    STREAM_ON: Final[LogStreamingOptionT] = "STREAM_ON"
+    STREAM_OFF: Final[LogStreamingOptionT] = "STREAM_OFF"
 
-class LogStreamingOption(str, Enum):
-    """Log streaming option."""
 
-    STREAM_DEFAULT = "STREAM_DEFAULT"
-    STREAM_ON = "STREAM_ON"
-    STREAM_OFF = "STREAM_OFF"
+LoggingModeT = Literal[
+    "LOGGING_UNSPECIFIED",
+    "LEGACY",
+    "GCS_ONLY",
+    "STACKDRIVER_ONLY",
+    "CLOUD_LOGGING_ONLY",
+    "NONE",
+]
+"""Logging mode."""
 
 
-class LoggingMode(str, Enum):
-    """Logging mode."""
+class LoggingMode:
+    """Named ``LoggingModeT`` values."""
 
-    LOGGING_UNSPECIFIED = "LOGGING_UNSPECIFIED"
-    LEGACY = "LEGACY"
-    GCS_ONLY = "GCS_ONLY"
-    STACKDRIVER_ONLY = "STACKDRIVER_ONLY"
-    CLOUD_LOGGING_ONLY = "CLOUD_LOGGING_ONLY"
-    NONE = "NONE"
+    LOGGING_UNSPECIFIED: Final[LoggingModeT] = "LOGGING_UNSPECIFIED"
+    LEGACY: Final[LoggingModeT] = "LEGACY"
+    GCS_ONLY: Final[LoggingModeT] = "GCS_ONLY"
+    STACKDRIVER_ONLY: Final[LoggingModeT] = "STACKDRIVER_ONLY"
+    CLOUD_LOGGING_ONLY: Final[LoggingModeT] = "CLOUD_LOGGING_ONLY"
+    NONE: Final[LoggingModeT] = "NONE"
 
 
-class MachineType(str, Enum):
-    """Machine type for build execution."""
+MachineTypeT = Literal[
+    "UNSPECIFIED",
+    "N1_HIGHCPU_8",
+    "N1_HIGHCPU_32",
+    "E2_HIGHCPU_8",
+    "E2_HIGHCPU_32",
+    "E2_MEDIUM",
+]
+"""Machine type for build execution."""
 
-    UNSPECIFIED = "UNSPECIFIED"
-    N1_HIGHCPU_8 = "N1_HIGHCPU_8"
-    N1_HIGHCPU_32 = "N1_HIGHCPU_32"
-    E2_HIGHCPU_8 = "E2_HIGHCPU_8"
-    E2_HIGHCPU_32 = "E2_HIGHCPU_32"
-    E2_MEDIUM = "E2_MEDIUM"
 
+class MachineType:
+    """Named ``MachineTypeT`` values."""
 
-class BuildStep(BaseModel):
+    UNSPECIFIED: Final[MachineTypeT] = "UNSPECIFIED"
+    N1_HIGHCPU_8: Final[MachineTypeT] = "N1_HIGHCPU_8"
+    N1_HIGHCPU_32: Final[MachineTypeT] = "N1_HIGHCPU_32"
+    E2_HIGHCPU_8: Final[MachineTypeT] = "E2_HIGHCPU_8"
+    E2_HIGHCPU_32: Final[MachineTypeT] = "E2_HIGHCPU_32"
+    E2_MEDIUM: Final[MachineTypeT] = "E2_MEDIUM"
+
+
+class Volume(_BaseModel):
+    """A volume mounted into build steps."""
+
+    name: str = Field(..., description="Volume name")
+    path: str = Field(..., description="Path to mount the volume at")
+
+
+# Shared by BuildStep and BuildOptions so both reference the same types.
+VolumeList = list[Volume] | None
+EnvList = list[str] | None
+
+
+class BuildStep(_FrozenModel):
     """A step in a Cloud Build."""
 
     name: str = Field(
@@ -73,7 +335,7 @@ class BuildStep(BaseModel):
     args: list[str] | None = Field(
         default=None, description="Arguments to pass to the builder"
     )
-    env: list[str] | None = Field(
+    env: EnvList = Field(
         default=None, description="Environment variables (KEY=value format)"
     )
     dir: str | None = Field(default=None, description="Working directory for the step")
@@ -84,27 +346,36 @@ class BuildStep(BaseModel):
     entrypoint: str | None = Field(
         default=None, description="Override entrypoint of the builder image"
     )
-    secret_env: list[str] | None = Field(
+    secret_env: EnvList = Field(
         default=None, description="Secret environment variable names"
     )
-    volumes: list[dict[str, str]] | None = Field(
-        default=None, description="Volumes to mount"
+    volumes: VolumeList = Field(default=None, description="Volumes to mount")
+    timeout_s: DurationSeconds | None = Field(
+        default=None,
+        validation_alias=_TIMEOUT_ALIASES,
+        serialization_alias="timeoutSeconds",
+        description="Step timeout in seconds (accepts '300s' via 'timeout')",
     )
-    timeout: str | None = Field(default=None, description="Step timeout (e.g., '300s')")
     script: str | None = Field(
         default=None, description="Script to execute (alternative to args)"
     )
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def timeout(self) -> str | None:
+        """Step timeout in API duration format (e.g., '300s')."""
+        return _format_duration(self.timeout_s)
+
 
-class StorageSource(BaseModel):
+class StorageSource(_BaseModel):
     """Source in Cloud Storage."""
 
     bucket: str = Field(..., description="GCS bucket name")
-    object_: str = Field(..., description="GCS object path", alias="object")
+    object_: str = Field(alias="object", description="GCS object path")
     generation: int | None = Field(default=None, description="Object generation number")
 
 
-class RepoSource(BaseModel):
+class RepoSource(_BaseModel):
     """Source in Cloud Source Repositories."""
 
     project_id: str | None = Field(
@@ -118,20 +389,38 @@ class RepoSource(BaseModel):
     invert_regex: bool = Field(default=False, description="Invert the regex match")
 
 
-class GitHubEventsConfig(BaseModel):
+class PullRequestFilter(_BaseModel):
+    """Pull request events that fire a GitHub trigger."""
+
+    branch: str | None = Field(default=None, description="Base branch regex")
+    comment_control: str | None = Field(
+        default=None, description="Whether builds need a /gcbrun comment"
+    )
+    invert_regex: bool = Field(default=False, description="Invert the branch match")
+
+
+class PushFilter(_BaseModel):
+    """Push events that fire a GitHub trigger."""
+
+    branch: str | None = Field(default=None, description="Branch regex")
+    tag: str | None = Field(default=None, description="Tag regex")
+    invert_regex: bool = Field(default=False, description="Invert the branch/tag match")
+
+
+class GitHubEventsConfig(_BaseModel):
     """GitHub events configuration for a trigger."""
 
     owner: str | None = Field(default=None, description="GitHub repository owner")
     name: str | None = Field(default=None, description="GitHub repository name")
-    pull_request: dict[str, Any] | None = Field(
+    pull_request: PullRequestFilter | None = Field(
         default=None, description="Pull request trigger configuration"
     )
-    push: dict[str, Any] | None = Field(
+    push: PushFilter | None = Field(
         default=None, description="Push trigger configuration"
     )
 
 
-class Source(BaseModel):
+class Source(_BaseModel):
     """Build source configuration."""
 
     storage_source: StorageSource | None = Field(
@@ -142,7 +431,7 @@ class Source(BaseModel):
     )
 
 
-class BuildOptions(BaseModel):
+class BuildOptions(_BaseModel):
     """Build execution options."""
 
     source_provenance_hash: list[str] | None = Field(
@@ -151,35 +440,33 @@ class BuildOptions(BaseModel):
     requested_verify_option: str | None = Field(
         default=None, description="Verification option (VERIFIED, NOT_VERIFIED)"
     )
-    machine_type: MachineType | None = Field(
+    machine_type: MachineTypeT | None = Field(
         default=None, description="Machine type for build execution"
     )
     disk_size_gb: int | None = Field(default=None, description="Disk size in GB")
-    substitution_option: SubstitutionOption | None = Field(
+    substitution_option: SubstitutionOptionT | None = Field(
         default=None, description="Substitution option"
     )
     dynamic_substitutions: bool | None = Field(
         default=None, description="Enable dynamic substitutions"
     )
-    log_streaming_option: LogStreamingOption | None = Field(
+    log_streaming_option: LogStreamingOptionT | None = Field(
         default=None, description="Log streaming option"
     )
     worker_pool: str | None = Field(
         default=None, description="Private worker pool resource name"
     )
-    logging: LoggingMode | None = Field(default=None, description="Logging mode")
-    env: list[str] | None = Field(
+    logging: LoggingModeT | None = Field(default=None, description="Logging mode")
+    env: EnvList = Field(
         default=None, description="Global environment variables (KEY=value format)"
     )
-    secret_env: list[str] | None = Field(
+    secret_env: EnvList = Field(
         default=None, description="Global secret environment variable names"
     )
-    volumes: list[dict[str, str]] | None = Field(
-        default=None, description="Global volumes to mount"
-    )
+    volumes: VolumeList = Field(default=None, description="Global volumes to mount")
 
 
-class BuildResults(BaseModel):
+class BuildResults(_BaseModel):
     """Build execution results."""
 
     images: list[dict[str, str]] | None = Field(
@@ -199,7 +486,58 @@ class BuildResults(BaseModel):
     )
 
 
-class Build(BaseModel):
+class TimeSpan(_BaseModel):
+    """Start and end times of a build phase."""
+
+    start_time: datetime | None = Field(default=None, description="Phase start time")
+    end_time: datetime | None = Field(default=None, description="Phase end time")
+
+
+class ArtifactObjects(_BaseModel):
+    """Non-container artifacts uploaded to Cloud Storage."""
+
+    location: str = Field(..., description="GCS path prefix to upload to")
+    paths: list[str] = Field(default_factory=list, description="Paths to upload")
+
+
+class Artifacts(_BaseModel):
+    """Artifacts to store on build success."""
+
+    model_config = ConfigDict(extra="allow")
+
+    images: list[str] | None = Field(
+        default=None, description="Container images to push"
+    )
+    objects: ArtifactObjects | None = Field(
+        default=None, description="Objects to upload to Cloud Storage"
+    )
+
+
+class SourceProvenance(_BaseModel):
+    """Source the build actually ran against, after resolving branches/tags."""
+
+    resolved_storage_source: StorageSource | None = Field(
+        default=None, description="Resolved Cloud Storage source"
+    )
+    resolved_repo_source: RepoSource | None = Field(
+        default=None, description="Resolved Cloud Source Repository source"
+    )
+    file_hashes: dict[str, Any] | None = Field(
+        default=None, description="Hashes of the source files, keyed by path"
+    )
+
+
+class Secret(_BaseModel):
+    """KMS-encrypted secrets exposed to build steps."""
+
+    kms_key_name: str = Field(..., description="KMS key used to decrypt the values")
+    secret_env: dict[str, str] = Field(
+        default_factory=dict,
+        description="Encrypted values keyed by environment variable name",
+    )
+
+
+class Build(_FrozenModel):
     """Cloud Build model."""
 
     id: str | None = Field(default=None, description="Build ID")
@@ -213,18 +551,26 @@ class Build(BaseModel):
     )
     start_time: datetime | None = Field(default=None, description="Build start time")
     finish_time: datetime | None = Field(default=None, description="Build finish time")
-    timeout: str | None = Field(
-        default="600s", description="Build timeout (e.g., '600s')"
+    timeout_s: DurationSeconds | None = Field(
+        default=600,
+        validation_alias=_TIMEOUT_ALIASES,
+        serialization_alias="timeoutSeconds",
+        description="Build timeout in seconds (accepts '600s' via 'timeout')",
     )
     images: list[str] | None = Field(
         default=None, description="Container images to build and push"
     )
-    queue_ttl: str | None = Field(default=None, description="Queue TTL (e.g., '3600s')")
-    artifacts: dict[str, Any] | None = Field(
+    queue_ttl_s: DurationSeconds | None = Field(
+        default=None,
+        validation_alias=_QUEUE_TTL_ALIASES,
+        serialization_alias="queueTtlSeconds",
+        description="Queue TTL in seconds (accepts '3600s' via 'queue_ttl')",
+    )
+    artifacts: Artifacts | None = Field(
         default=None, description="Artifacts configuration"
     )
     logs_bucket: str | None = Field(default=None, description="GCS bucket for logs")
-    source_provenance: dict[str, Any] | None = Field(
+    source_provenance: SourceProvenance | None = Field(
         default=None, description="Source provenance information"
     )
     build_trigger_id: str | None = Field(
@@ -238,15 +584,41 @@ class Build(BaseModel):
         default=None, description="Substitution variables"
     )
     tags: list[str] | None = Field(default=None, description="Build tags")
-    secrets: list[dict[str, Any]] | None = Field(
+    secrets: list[Secret] | None = Field(
         default=None, description="Secrets to make available"
     )
-    timing: dict[str, Any] | None = Field(
+    timing: dict[str, TimeSpan] | None = Field(
         default=None, description="Timing information for build phases"
     )
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def timeout(self) -> str | None:
+        """Build timeout in API duration format (e.g., '600s')."""
+        return _format_duration(self.timeout_s)
 
-class BuildTrigger(BaseModel):
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def queue_ttl(self) -> str | None:
+        """Queue TTL in API duration format (e.g., '3600s')."""
+        return _format_duration(self.queue_ttl_s)
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "Build":
+        """
+        Construct a Build from an already-validated API payload without validation.
+
+        Nested models (steps, source, options, ...) are constructed the same way.
+        Durations such as ``"600s"``, RFC 3339 timestamps and enum values such
+        as ``status`` are parsed from their API string forms.
+        Only use this for data produced by the Cloud Build API or by
+        ``model_dump()``; never for user-supplied input such as cloudbuild.yaml,
+        which must go through ``model_validate()``.
+        """
+        return _construct(cls, data)
+
+
+class BuildTrigger(_FrozenModel):
     """Cloud Build trigger model."""
 
     id: str | None = Field(default=None, description="Trigger ID")
@@ -280,8 +652,34 @@ class BuildTrigger(BaseModel):
     )
     filter: str | None = Field(default=None, description="CEL expression filter")
 
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "BuildTrigger":
+        """
+        Construct a BuildTrigger from an already-validated API payload.
+
+        See ``Build.from_trusted()``; the same restriction on untrusted input applies.
+        """
+        return _construct(cls, data)
+
+
+# Page validators, shared across calls. Like the models, they build on first use.
+_BUILD_LIST_ADAPTER = TypeAdapter(list[Build], config=ConfigDict(defer_build=True))
+_TRIGGER_LIST_ADAPTER = TypeAdapter(
+    list[BuildTrigger], config=ConfigDict(defer_build=True)
+)
+
 
-class BuildListResponse(BaseModel):
+def decode_build_list(raw: bytes | str) -> list[Build]:
+    """
+    Decode and validate a JSON array of builds in one pass.
+
+    The JSON is parsed by pydantic-core straight into ``Build`` instances,
+    without an intermediate ``json.loads()`` and dict walk.
+    """
+    return _BUILD_LIST_ADAPTER.validate_json(raw)
+
+
+class BuildListResponse(_BaseModel):
     """Response model for listing builds."""
 
     builds: list[Build] = Field(default_factory=list, description="List of builds")
@@ -289,8 +687,28 @@ class BuildListResponse(BaseModel):
         default=None, description="Token for fetching the next page"
     )
 
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "BuildListResponse":
+        """Construct from a trusted API payload (see ``Build.from_trusted()``)."""
+        return _construct(cls, data)
+
+    @classmethod
+    def from_api(cls, raw: dict[str, Any]) -> "BuildListResponse":
+        """
+        Validate a page of builds from an API payload.
 
-class TriggerListResponse(BaseModel):
+        The whole ``builds`` list is validated in a single call to a cached
+        validator rather than one ``Build.model_validate()`` per item.
+        """
+        return cls.model_construct(
+            builds=_BUILD_LIST_ADAPTER.validate_python(raw.get("builds", [])),
+            next_page_token=(
+                raw.get("nextPageToken") or raw.get("next_page_token") or None
+            ),
+        )
+
+
+class TriggerListResponse(_BaseModel):
     """Response model for listing build triggers."""
 
     triggers: list[BuildTrigger] = Field(
@@ -300,8 +718,23 @@ class TriggerListResponse(BaseModel):
         default=None, description="Token for fetching the next page"
     )
 
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "TriggerListResponse":
+        """Construct from a trusted API payload (see ``Build.from_trusted()``)."""
+        return _construct(cls, data)
+
+    @classmethod
+    def from_api(cls, raw: dict[str, Any]) -> "TriggerListResponse":
+        """Validate a page of triggers (see ``BuildListResponse.from_api()``)."""
+        return cls.model_construct(
+            triggers=_TRIGGER_LIST_ADAPTER.validate_python(raw.get("triggers", [])),
+            next_page_token=(
+                raw.get("nextPageToken") or raw.get("next_page_token") or None
+            ),
+        )
+
 
-class RunBuildTriggerResponse(BaseModel):
+class RunBuildTriggerResponse(_BaseModel):
     """Response model for running a build trigger."""
 
     build_id: str = Field(..., description="ID of the created build")
@@ -5,11 +5,31 @@ This module provides type-safe models for Cloud Functions resources including
 functions, event triggers, build configurations, and runtime settings.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import AliasGenerator, ConfigDict, Field, TypeAdapter
+from pydantic.alias_generators import to_camel
+
+from ._common import (
+    InternedStr,
+    JSONBytesModel,
+    parse_cpu_millicores,
+    parse_memory_bytes,
+)
+
+
+class _BaseModel(JSONBytesModel):
+    """Base for Cloud Functions models; schemas are built on first use."""
+
+    # REST payloads use camelCase keys; dumps keep the snake_case field names.
+    model_config = ConfigDict(
+        defer_build=True,
+        alias_generator=AliasGenerator(validation_alias=to_camel),
+        validate_by_name=True,
+    )
 
 
 class FunctionState(str, Enum):
@@ -100,27 +120,29 @@ class EventType(str, Enum):
     FIREBASE_DATABASE_REF_WRITE = "google.firebase.database.ref.v1.written"
 
 
-class SecretEnvVar(BaseModel):
+class SecretEnvVar(_BaseModel):
     """Environment variable from Secret Manager."""
 
     key: str = Field(..., description="Environment variable name")
-    project_id: str = Field(..., description="Project ID containing the secret")
+    project_id: InternedStr = Field(..., description="Project ID containing the secret")
     secret: str = Field(..., description="Secret name")
     version: str = Field(default="latest", description="Secret version")
 
+    model_config = ConfigDict(frozen=True)
+
 
-class SecretVolume(BaseModel):
+class SecretVolume(_BaseModel):
     """Secret mounted as a volume."""
 
     mount_path: str = Field(..., description="Path to mount the secret")
-    project_id: str = Field(..., description="Project ID containing the secret")
+    project_id: InternedStr = Field(..., description="Project ID containing the secret")
     secret: str = Field(..., description="Secret name")
     versions: list[dict[str, str]] = Field(
         default_factory=list, description="Secret versions to mount"
     )
 
 
-class ServiceConfig(BaseModel):
+class ServiceConfig(_BaseModel):
     """Configuration for the function service."""
 
     available_memory: str | None = Field(
@@ -164,7 +186,7 @@ class ServiceConfig(BaseModel):
     secret_volumes: list[SecretVolume] | None = Field(
         default=None, description="Secrets mounted as volumes"
     )
-    service_account_email: str | None = Field(
+    service_account_email: InternedStr | None = Field(
         default=None, description="Service account email for the function"
     )
     ingress_settings: IngressSettings | None = Field(
@@ -178,8 +200,20 @@ class ServiceConfig(BaseModel):
         default=True, description="Route all traffic to the latest revision"
     )
 
+    @property
+    def memory_bytes(self) -> int | None:
+        """Memory allocation in bytes, parsed from ``available_memory``."""
+        return (
+            parse_memory_bytes(self.available_memory) if self.available_memory else None
+        )
+
+    @property
+    def cpu_millicores(self) -> int | None:
+        """CPU allocation in millicores, parsed from ``available_cpu``."""
+        return parse_cpu_millicores(self.available_cpu) if self.available_cpu else None
 
-class BuildConfig(BaseModel):
+
+class BuildConfig(_BaseModel):
     """Build configuration for the function."""
 
     runtime: Runtime = Field(..., description="Runtime for the function")
@@ -199,20 +233,22 @@ class BuildConfig(BaseModel):
     worker_pool: str | None = Field(default=None, description="Cloud Build worker pool")
 
 
-class EventFilter(BaseModel):
+@dataclass(slots=True, frozen=True)
+class EventFilter:
     """Event filter for event-driven functions."""
 
-    attribute: str = Field(..., description="Filter attribute name")
-    value: str = Field(..., description="Filter value")
-    operator: str | None = Field(
-        default=None, description="Filter operator (e.g., 'match-path-pattern')"
-    )
+    attribute: str
+    """Filter attribute name"""
+    value: str
+    """Filter value"""
+    operator: str | None = None
+    """Filter operator (e.g., 'match-path-pattern')"""
 
 
-class EventTrigger(BaseModel):
+class EventTrigger(_BaseModel):
     """Event trigger configuration."""
 
-    trigger_region: str | None = Field(
+    trigger_region: InternedStr | None = Field(
         default=None, description="Region where events are received"
     )
     event_type: str = Field(..., description="Event type that triggers the function")
@@ -222,7 +258,7 @@ class EventTrigger(BaseModel):
     pubsub_topic: str | None = Field(
         default=None, description="Pub/Sub topic name for Pub/Sub triggers"
     )
-    service_account_email: str | None = Field(
+    service_account_email: InternedStr | None = Field(
         default=None, description="Service account for invoking the function"
     )
     retry_policy: str | None = Field(
@@ -232,7 +268,7 @@ class EventTrigger(BaseModel):
     channel: str | None = Field(default=None, description="Eventarc channel name")
 
 
-class CloudFunction(BaseModel):
+class CloudFunction(_BaseModel):
     """Cloud Function resource model."""
 
     name: str = Field(..., description="Function resource name")
@@ -259,7 +295,12 @@ class CloudFunction(BaseModel):
     )
 
 
-class FunctionListResponse(BaseModel):
+_FUNCTION_LIST_ADAPTER = TypeAdapter(
+    list[CloudFunction], config=ConfigDict(defer_build=True)
+)
+
+
+class FunctionListResponse(_BaseModel):
     """Response model for listing functions."""
 
     functions: list[CloudFunction] = Field(
@@ -272,8 +313,24 @@ class FunctionListResponse(BaseModel):
         default_factory=list, description="Locations that could not be reached"
     )
 
+    @classmethod
+    def from_api(cls, raw: dict[str, Any]) -> "FunctionListResponse":
+        """
+        Validate a page of functions from a REST payload (camelCase or snake_case).
+
+        The whole ``functions`` list is validated in a single call to a cached
+        validator rather than one ``CloudFunction.model_validate()`` per item.
+        """
+        return cls.model_construct(
+            functions=_FUNCTION_LIST_ADAPTER.validate_python(raw.get("functions", [])),
+            next_page_token=(
+                raw.get("nextPageToken") or raw.get("next_page_token") or None
+            ),
+            unreachable=list(raw.get("unreachable", [])),
+        )
+
 
-class GenerateUploadUrlResponse(BaseModel):
+class GenerateUploadUrlResponse(_BaseModel):
     """Response from generating an upload URL."""
 
     upload_url: str = Field(..., description="Signed URL for uploading source code")
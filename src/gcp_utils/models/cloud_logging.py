@@ -2,14 +2,35 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from pydantic import (
+    AliasGenerator,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    field_validator,
+)
+from pydantic.alias_generators import to_camel
+
+from ._common import InternedStr, JSONBytesModel
 
 if TYPE_CHECKING:
     from google.cloud.logging_v2 import entries
 
 
+class _BaseModel(JSONBytesModel):
+    """Base for Cloud Logging models; schemas are built on first use, not at import."""
+
+    # REST payloads use camelCase keys; dumps keep the snake_case field names.
+    model_config = ConfigDict(
+        defer_build=True,
+        alias_generator=AliasGenerator(validation_alias=to_camel),
+        validate_by_name=True,
+    )
+
+
 class LogSeverity(str, Enum):
     """
     Log entry severity levels.
@@ -28,7 +49,7 @@ class LogSeverity(str, Enum):
     EMERGENCY = "EMERGENCY"
 
 
-class HttpRequestInfo(BaseModel):
+class HttpRequestInfo(_BaseModel):
     """HTTP request information for structured logs."""
 
     request_method: str | None = Field(None, description="HTTP request method")
@@ -49,20 +70,28 @@ class HttpRequestInfo(BaseModel):
         None, description="Whether cache was validated with origin"
     )
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(frozen=True)
 
+    @field_validator("latency", mode="before")
+    @classmethod
+    def parse_latency(cls, v: Any) -> Any:
+        """Accept the REST duration form (e.g. ``"0.25s"``) as seconds."""
+        if isinstance(v, str) and v.endswith("s"):
+            return v[:-1]
+        return v
 
-class SourceLocation(BaseModel):
+
+class SourceLocation(_BaseModel):
     """Source code location information."""
 
     file: str | None = Field(None, description="Source file name")
     line: int | None = Field(None, description="Line number")
     function: str | None = Field(None, description="Function name")
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(frozen=True)
 
 
-class LogEntry(BaseModel):
+class LogEntry(_BaseModel):
     """
     A log entry with structured metadata.
 
@@ -78,7 +107,7 @@ class LogEntry(BaseModel):
         ... )
     """
 
-    log_name: str = Field(..., description="Full log name path")
+    log_name: InternedStr = Field(..., description="Full log name path")
     resource: dict[str, Any] = Field(..., description="Monitored resource")
     timestamp: datetime | None = Field(None, description="Log entry timestamp")
     receive_timestamp: datetime | None = Field(
@@ -121,7 +150,12 @@ class LogEntry(BaseModel):
     # The actual log entry object (private attribute, not serialized)
     _entry_object: Optional["entries.StructEntry"] = PrivateAttr(default=None)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    # Optional fields copied into to_dict() output when set
+    _TO_DICT_FIELDS: ClassVar[tuple[str, ...]] = ("labels", "trace", "span_id")
+    _TO_DICT_SUBMODELS: ClassVar[tuple[str, ...]] = (
+        "http_request",
+        "source_location",
+    )
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -139,9 +173,6 @@ class LogEntry(BaseModel):
         if self.timestamp:
             entry_dict["timestamp"] = self.timestamp.isoformat()
 
-        if self.labels:
-            entry_dict["labels"] = self.labels
-
         if self.text_payload:
             entry_dict["text_payload"] = self.text_payload
         elif self.json_payload:
@@ -149,24 +180,42 @@ class LogEntry(BaseModel):
         elif self.proto_payload:
             entry_dict["proto_payload"] = self.proto_payload
 
-        if self.http_request:
-            entry_dict["http_request"] = self.http_request.model_dump(exclude_none=True)
+        for name in self._TO_DICT_FIELDS:
+            value = getattr(self, name)
+            if value:
+                entry_dict[name] = value
 
-        if self.source_location:
-            entry_dict["source_location"] = self.source_location.model_dump(
-                exclude_none=True
-            )
+        # Submodels are flat, so filtering __dict__ matches
+        # model_dump(exclude_none=True) without a serializer round trip.
+        for name in self._TO_DICT_SUBMODELS:
+            submodel = getattr(self, name)
+            if submodel:
+                entry_dict[name] = {
+                    k: v for k, v in submodel.__dict__.items() if v is not None
+                }
 
-        if self.trace:
-            entry_dict["trace"] = self.trace
+        return entry_dict
 
-        if self.span_id:
-            entry_dict["span_id"] = self.span_id
 
-        return entry_dict
+_LOG_ENTRY_LIST_ADAPTER = TypeAdapter(
+    list[LogEntry], config=ConfigDict(defer_build=True)
+)
 
 
-class LogMetric(BaseModel):
+def validate_log_entries(raw: list[dict[str, Any]]) -> list[LogEntry]:
+    """
+    Validate a batch of log entry payloads in one pass.
+
+    Entries may use the REST API's camelCase keys (``logName``,
+    ``textPayload``, ...) or the snake_case field names.
+
+    The list is validated by a single cached validator rather than one
+    ``LogEntry.model_validate()`` per entry.
+    """
+    return _LOG_ENTRY_LIST_ADAPTER.validate_python(raw)
+
+
+class LogMetric(_BaseModel):
     """
     A logs-based metric definition.
 
@@ -198,10 +247,8 @@ class LogMetric(BaseModel):
         None, description="Distribution bucket options"
     )
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
 
-class LogSink(BaseModel):
+class LogSink(_BaseModel):
     """
     A log sink for exporting logs to external destinations.
 
@@ -228,10 +275,8 @@ class LogSink(BaseModel):
     create_time: datetime | None = Field(None, description="Sink creation time")
     update_time: datetime | None = Field(None, description="Last update time")
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
 
-
-class LoggerInfo(BaseModel):
+class LoggerInfo(_BaseModel):
     """
     Information about a logger.
 
@@ -243,5 +288,3 @@ class LoggerInfo(BaseModel):
         None, description="Default monitored resource"
     )
     labels: dict[str, str] = Field(default_factory=dict, description="Default labels")
-
-    model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -1,16 +1,32 @@
 """Data models for Cloud Run operations."""
 
-from datetime import datetime
+from collections.abc import Iterable
+from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Optional
+from operator import attrgetter
+from typing import TYPE_CHECKING, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_serializer
+from pydantic import ConfigDict, Field, PrivateAttr
+
+from ._common import (
+    InternedStr,
+    IsoDateTime,
+    JSONBytesModel,
+    parse_cpu_millicores,
+    parse_memory_bytes,
+)
 
 if TYPE_CHECKING:
     from google.cloud.run_v2 import Execution, Job, Service
 
 
-class TrafficTarget(BaseModel):
+class _BaseModel(JSONBytesModel):
+    """Base for Cloud Run models; schemas are built on first use, not at import."""
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class TrafficTarget(_BaseModel):
     """Traffic target for Cloud Run service."""
 
     revision_name: str | None = Field(None, description="Revision name")
@@ -20,25 +36,25 @@ class TrafficTarget(BaseModel):
         default=False, description="Whether to target latest revision"
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
-class ServiceRevision(BaseModel):
+class ServiceRevision(_BaseModel):
     """Cloud Run service revision information."""
 
     name: str = Field(..., description="Revision name")
     service_name: str = Field(..., description="Service name")
     image: str = Field(..., description="Container image")
-    created: datetime | None = Field(None, description="Creation timestamp")
+    created: IsoDateTime | None = Field(None, description="Creation timestamp")
     traffic_percent: int = Field(default=0, description="Percentage of traffic")
     max_instances: int | None = Field(None, description="Maximum number of instances")
     min_instances: int | None = Field(None, description="Minimum number of instances")
     timeout: int | None = Field(None, description="Request timeout in seconds")
 
-    @field_serializer("created")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-        return dt.isoformat() if dt else None
+    model_config = ConfigDict(frozen=True)
 
 
-class CloudRunService(BaseModel):
+class CloudRunService(_BaseModel):
     """
     Cloud Run service information with native object binding.
 
@@ -58,11 +74,11 @@ class CloudRunService(BaseModel):
     """
 
     name: str = Field(..., description="Service name")
-    region: str = Field(..., description="Service region")
+    region: InternedStr = Field(..., description="Service region")
     image: str = Field(..., description="Current container image")
     url: str = Field(..., description="Service URL")
-    created: datetime | None = Field(None, description="Creation timestamp")
-    updated: datetime | None = Field(None, description="Last update timestamp")
+    created: IsoDateTime | None = Field(None, description="Creation timestamp")
+    updated: IsoDateTime | None = Field(None, description="Last update timestamp")
     latest_revision: str | None = Field(None, description="Latest revision name")
     traffic: list[TrafficTarget] = Field(
         default_factory=list, description="Traffic split configuration"
@@ -72,12 +88,6 @@ class CloudRunService(BaseModel):
     # The actual Service object (private attribute, not serialized)
     _service_object: Optional["Service"] = PrivateAttr(default=None)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
-    @field_serializer("created", "updated")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-        return dt.isoformat() if dt else None
-
     # Convenience methods that delegate to controller operations
 
     def delete(self) -> None:
@@ -147,15 +157,17 @@ class LaunchStage(str, Enum):
     DEPRECATED = "DEPRECATED"
 
 
-class TaskAttemptResult(BaseModel):
+class TaskAttemptResult(_BaseModel):
     """Result of a task attempt in a job execution."""
 
     status: ExecutionStatus = Field(..., description="Status of the task attempt")
     exit_code: int | None = Field(None, description="Exit code of the task")
     error_message: str | None = Field(None, description="Error message if failed")
 
+    model_config = ConfigDict(frozen=True)
+
 
-class CloudRunJob(BaseModel):
+class CloudRunJob(_BaseModel):
     """
     Cloud Run job information with native object binding.
 
@@ -174,10 +186,10 @@ class CloudRunJob(BaseModel):
     """
 
     name: str = Field(..., description="Job name")
-    region: str = Field(..., description="Job region")
+    region: InternedStr = Field(..., description="Job region")
     image: str = Field(..., description="Container image")
-    created: datetime | None = Field(None, description="Creation timestamp")
-    updated: datetime | None = Field(None, description="Last update timestamp")
+    created: IsoDateTime | None = Field(None, description="Creation timestamp")
+    updated: IsoDateTime | None = Field(None, description="Last update timestamp")
     labels: dict[str, str] = Field(default_factory=dict, description="Job labels")
 
     # Execution configuration
@@ -198,7 +210,9 @@ class CloudRunJob(BaseModel):
     env_vars: dict[str, str] = Field(
         default_factory=dict, description="Environment variables"
     )
-    service_account: str | None = Field(None, description="Service account email")
+    service_account: InternedStr | None = Field(
+        None, description="Service account email"
+    )
     execution_environment: ExecutionEnvironment = Field(
         default=ExecutionEnvironment.EXECUTION_ENVIRONMENT_GEN2,
         description="Execution environment",
@@ -216,14 +230,18 @@ class CloudRunJob(BaseModel):
     # The actual Job object (private attribute, not serialized)
     _job_object: Optional["Job"] = PrivateAttr(default=None)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    @property
+    def cpu_millicores(self) -> int | None:
+        """CPU allocation in millicores, parsed from ``cpu``."""
+        return parse_cpu_millicores(self.cpu) if self.cpu else None
 
-    @field_serializer("created", "updated")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-        return dt.isoformat() if dt else None
+    @property
+    def memory_bytes(self) -> int | None:
+        """Memory allocation in bytes, parsed from ``memory``."""
+        return parse_memory_bytes(self.memory) if self.memory else None
 
 
-class JobExecution(BaseModel):
+class JobExecution(_BaseModel):
     """
     Cloud Run job execution information.
 
@@ -241,13 +259,13 @@ class JobExecution(BaseModel):
     name: str = Field(..., description="Execution name (full resource path)")
     execution_id: str = Field(..., description="Short execution ID")
     job_name: str = Field(..., description="Parent job name")
-    region: str = Field(..., description="Execution region")
+    region: InternedStr = Field(..., description="Execution region")
 
     # Status and timing
     status: ExecutionStatus = Field(..., description="Current execution status")
-    created: datetime | None = Field(None, description="Creation timestamp")
-    started: datetime | None = Field(None, description="Start timestamp")
-    completed: datetime | None = Field(None, description="Completion timestamp")
+    created: IsoDateTime | None = Field(None, description="Creation timestamp")
+    started: IsoDateTime | None = Field(None, description="Start timestamp")
+    completed: IsoDateTime | None = Field(None, description="Completion timestamp")
     duration_seconds: int | None = Field(
         None, description="Execution duration in seconds"
     )
@@ -270,8 +288,45 @@ class JobExecution(BaseModel):
     # The actual Execution object (private attribute, not serialized)
     _execution_object: Optional["Execution"] = PrivateAttr(default=None)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    @field_serializer("created", "started", "completed")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-        return dt.isoformat() if dt else None
+_TASK_COUNTS = attrgetter(
+    "task_count",
+    "succeeded_count",
+    "failed_count",
+    "cancelled_count",
+    "running_count",
+    "pending_count",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class ExecutionTaskTotals:
+    """Task counters summed over a set of job executions."""
+
+    task_count: int = 0
+    """Total number of tasks"""
+    succeeded_count: int = 0
+    """Number of succeeded tasks"""
+    failed_count: int = 0
+    """Number of failed tasks"""
+    cancelled_count: int = 0
+    """Number of cancelled tasks"""
+    running_count: int = 0
+    """Number of running tasks"""
+    pending_count: int = 0
+    """Number of pending tasks"""
+
+
+def aggregate_executions(executions: Iterable[JobExecution]) -> ExecutionTaskTotals:
+    """
+    Sum the task counters of many executions in one pass.
+
+    Each execution's six counters are read with a single ``attrgetter`` call
+    and the columns are summed by the builtin ``sum``.
+
+    Example:
+        >>> totals = aggregate_executions(run_ctrl.list_executions("my-job"))
+        >>> print(f"{totals.failed_count}/{totals.task_count} tasks failed")
+    """
+    rows = [_TASK_COUNTS(execution) for execution in executions]
+    return ExecutionTaskTotals(*(sum(column) for column in zip(*rows, strict=True)))
@@ -5,10 +5,51 @@ This module provides type-safe models for Cloud Scheduler resources including
 jobs, schedules, HTTP targets, Pub/Sub targets, and App Engine targets.
 """
 
+import re
+import zoneinfo
 from datetime import datetime
 from enum import Enum
+from functools import cache
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import AliasGenerator, ConfigDict, Field, TypeAdapter, field_validator
+from pydantic.alias_generators import to_camel
+
+from ._common import InternedStr, JSONBytesModel
+
+# A token that can only be part of a unix-cron expression: digits and cron
+# operators, or three-letter month/day names (e.g. "MON-FRI", "JAN,JUL").
+_CRON_TOKEN_RE = re.compile(r"[\d*/,-]+|[A-Za-z]{3}(?:[,-][A-Za-z]{3})*")
+_CRON_RE = re.compile(r"\S+(?:[ \t]+\S+){4}")
+
+
+@cache
+def _known_time_zones() -> frozenset[str]:
+    return frozenset(zoneinfo.available_timezones())
+
+
+def check_cron_schedule(schedule: str) -> str:
+    """
+    Check that a unix-cron ``schedule`` has exactly five fields.
+
+    The API also accepts English-like schedules (e.g. ``"every 5 minutes"``);
+    anything that is not made up of cron tokens is left for it to validate.
+    """
+    looks_like_cron = all(_CRON_TOKEN_RE.fullmatch(t) for t in schedule.split())
+    if looks_like_cron and not _CRON_RE.fullmatch(schedule):
+        raise ValueError(f"Invalid cron schedule: {schedule!r}")
+    return schedule
+
+
+class _BaseModel(JSONBytesModel):
+    """Base for Cloud Scheduler models; schemas are built on first use."""
+
+    # REST payloads use camelCase keys; dumps keep the snake_case field names.
+    model_config = ConfigDict(
+        defer_build=True,
+        alias_generator=AliasGenerator(validation_alias=to_camel),
+        validate_by_name=True,
+    )
 
 
 class JobState(str, Enum):
@@ -34,7 +75,7 @@ class HttpMethod(str, Enum):
     OPTIONS = "OPTIONS"
 
 
-class OAuthToken(BaseModel):
+class OAuthToken(_BaseModel):
     """OAuth token configuration for HTTP target authentication."""
 
     service_account_email: str = Field(
@@ -42,8 +83,10 @@ class OAuthToken(BaseModel):
     )
     scope: str | None = Field(default=None, description="OAuth scope (optional)")
 
+    model_config = ConfigDict(frozen=True)
+
 
-class OidcToken(BaseModel):
+class OidcToken(_BaseModel):
     """OIDC token configuration for HTTP target authentication."""
 
     service_account_email: str = Field(
@@ -53,8 +96,10 @@ class OidcToken(BaseModel):
         default=None, description="OIDC audience claim (optional)"
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
-class HttpTarget(BaseModel):
+class HttpTarget(_BaseModel):
     """HTTP target configuration for a Cloud Scheduler job."""
 
     uri: str = Field(..., description="HTTP URI to invoke")
@@ -77,7 +122,7 @@ class HttpTarget(BaseModel):
     )
 
 
-class PubsubTarget(BaseModel):
+class PubsubTarget(_BaseModel):
     """Pub/Sub target configuration for a Cloud Scheduler job."""
 
     topic_name: str = Field(
@@ -89,7 +134,7 @@ class PubsubTarget(BaseModel):
     )
 
 
-class AppEngineHttpTarget(BaseModel):
+class AppEngineHttpTarget(_BaseModel):
     """App Engine HTTP target configuration."""
 
     http_method: HttpMethod = Field(
@@ -103,7 +148,7 @@ class AppEngineHttpTarget(BaseModel):
     body: bytes | None = Field(default=None, description="HTTP request body")
 
 
-class RetryConfig(BaseModel):
+class RetryConfig(_BaseModel):
     """Retry configuration for a Cloud Scheduler job."""
 
     retry_count: int | None = Field(
@@ -131,8 +176,10 @@ class RetryConfig(BaseModel):
         le=16,
     )
 
+    model_config = ConfigDict(frozen=True)
 
-class SchedulerJob(BaseModel):
+
+class SchedulerJob(_BaseModel):
     """Cloud Scheduler job model."""
 
     name: str = Field(..., description="Job resource name")
@@ -141,7 +188,7 @@ class SchedulerJob(BaseModel):
         ...,
         description="Job schedule in cron format (e.g., '0 9 * * 1' for 9 AM every Monday)",
     )
-    time_zone: str = Field(
+    time_zone: InternedStr = Field(
         default="America/Los_Angeles",
         description="IANA time zone (e.g., 'America/New_York', 'UTC')",
     )
@@ -172,8 +219,26 @@ class SchedulerJob(BaseModel):
         default=None, description="Time when the job was last modified by a user"
     )
 
+    @field_validator("schedule")
+    @classmethod
+    def validate_schedule(cls, v: str) -> str:
+        """Validate the field count of unix-cron schedules."""
+        return check_cron_schedule(v)
+
+    @field_validator("time_zone")
+    @classmethod
+    def validate_time_zone(cls, v: str) -> str:
+        """Validate the time zone against the IANA database, when available."""
+        zones = _known_time_zones()
+        if zones and v not in zones:
+            raise ValueError(f"Unknown time zone: {v!r}")
+        return v
 
-class JobListResponse(BaseModel):
+
+_JOB_LIST_ADAPTER = TypeAdapter(list[SchedulerJob], config=ConfigDict(defer_build=True))
+
+
+class JobListResponse(_BaseModel):
     """Response model for listing Cloud Scheduler jobs."""
 
     jobs: list[SchedulerJob] = Field(default_factory=list, description="List of jobs")
@@ -181,22 +246,37 @@ class JobListResponse(BaseModel):
         default=None, description="Token for fetching the next page"
     )
 
+    @classmethod
+    def from_api(cls, raw: dict[str, Any]) -> "JobListResponse":
+        """
+        Validate a page of jobs from a REST payload (camelCase or snake_case keys).
+
+        The whole ``jobs`` list is validated in a single call to a cached
+        validator rather than one ``SchedulerJob.model_validate()`` per item.
+        """
+        return cls.model_construct(
+            jobs=_JOB_LIST_ADAPTER.validate_python(raw.get("jobs", [])),
+            next_page_token=(
+                raw.get("nextPageToken") or raw.get("next_page_token") or None
+            ),
+        )
+
 
-class PauseJobResponse(BaseModel):
+class PauseJobResponse(_BaseModel):
     """Response model for pausing a job."""
 
     name: str = Field(..., description="Job resource name")
     state: JobState = Field(..., description="Job state after pausing")
 
 
-class ResumeJobResponse(BaseModel):
+class ResumeJobResponse(_BaseModel):
     """Response model for resuming a job."""
 
     name: str = Field(..., description="Job resource name")
     state: JobState = Field(..., description="Job state after resuming")
 
 
-class RunJobResponse(BaseModel):
+class RunJobResponse(_BaseModel):
     """Response model for manually running a job."""
 
     name: str = Field(..., description="Job resource name")
@@ -1,10 +1,17 @@
 """Data models for Firebase Hosting operations."""
 
-from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer
+from pydantic import ConfigDict, Field
+
+from ._common import IsoDateTime, JSONBytesModel
+
+
+class _BaseModel(JSONBytesModel):
+    """Base for Firebase Hosting models; schemas are built on first use."""
+
+    model_config = ConfigDict(defer_build=True)
 
 
 class DomainStatus(str, Enum):
@@ -29,7 +36,7 @@ class VersionStatus(str, Enum):
     DELETED = "DELETED"
 
 
-class HostingSite(BaseModel):
+class HostingSite(_BaseModel):
     """Information about a Firebase Hosting site."""
 
     name: str = Field(..., description="Full resource name of the site")
@@ -45,7 +52,7 @@ class HostingSite(BaseModel):
     model_config = ConfigDict(use_enum_values=True)
 
 
-class CustomDomain(BaseModel):
+class CustomDomain(_BaseModel):
     """Information about a custom domain."""
 
     domain_name: str = Field(..., description="The custom domain name")
@@ -56,19 +63,14 @@ class CustomDomain(BaseModel):
         None, description="DNS provisioning information"
     )
 
-    update_time: datetime | None = Field(None, description="Last update timestamp")
+    update_time: IsoDateTime | None = Field(None, description="Last update timestamp")
 
     cert: dict[str, Any] | None = Field(None, description="SSL certificate information")
 
     model_config = ConfigDict(use_enum_values=True)
 
-    @field_serializer("update_time")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
 
-        return dt.isoformat() if dt else None
-
-
-class HostingVersion(BaseModel):
+class HostingVersion(_BaseModel):
     """Information about a hosting version."""
 
     name: str = Field(..., description="Full resource name of the version")
@@ -79,9 +81,11 @@ class HostingVersion(BaseModel):
 
     config: dict[str, Any] | None = Field(None, description="Version configuration")
 
-    create_time: datetime | None = Field(None, description="Creation timestamp")
+    create_time: IsoDateTime | None = Field(None, description="Creation timestamp")
 
-    finalize_time: datetime | None = Field(None, description="Finalization timestamp")
+    finalize_time: IsoDateTime | None = Field(
+        None, description="Finalization timestamp"
+    )
 
     file_count: int | None = Field(None, description="Number of files in version")
 
@@ -89,13 +93,8 @@ class HostingVersion(BaseModel):
 
     model_config = ConfigDict(use_enum_values=True)
 
-    @field_serializer("create_time", "finalize_time")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-
-        return dt.isoformat() if dt else None
 
-
-class HostingRelease(BaseModel):
+class HostingRelease(_BaseModel):
     """Information about a hosting release."""
 
     name: str = Field(..., description="Full resource name of the release")
@@ -104,19 +103,14 @@ class HostingRelease(BaseModel):
 
     message: str | None = Field(None, description="Release message")
 
-    release_time: datetime | None = Field(None, description="Release timestamp")
+    release_time: IsoDateTime | None = Field(None, description="Release timestamp")
 
     release_user: dict[str, str] | None = Field(
         None, description="User who created the release"
     )
 
-    @field_serializer("release_time")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-
-        return dt.isoformat() if dt else None
 
-
-class RedirectRule(BaseModel):
+class RedirectRule(_BaseModel):
     """Configuration for a redirect rule."""
 
     source: str = Field(..., description="Source URL pattern")
@@ -127,8 +121,10 @@ class RedirectRule(BaseModel):
         301, description="HTTP redirect type (301 permanent, 302 temporary)"
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
-class RewriteRule(BaseModel):
+class RewriteRule(_BaseModel):
     """Configuration for a rewrite rule."""
 
     source: str = Field(..., description="Source URL pattern to match")
@@ -139,16 +135,20 @@ class RewriteRule(BaseModel):
 
     run: dict[str, str] | None = Field(None, description="Cloud Run service to invoke")
 
+    model_config = ConfigDict(frozen=True)
 
-class HeaderRule(BaseModel):
+
+class HeaderRule(_BaseModel):
     """Configuration for custom headers."""
 
     source: str = Field(..., description="URL pattern to match")
 
     headers: dict[str, str] = Field(..., description="Headers to set")
 
+    model_config = ConfigDict(frozen=True)
+
 
-class HostingConfig(BaseModel):
+class HostingConfig(_BaseModel):
     """Configuration for a hosting version."""
 
     redirects: list[RedirectRule] = Field(
@@ -174,7 +174,7 @@ class HostingConfig(BaseModel):
     model_config = ConfigDict(use_enum_values=True)
 
 
-class DeploymentInfo(BaseModel):
+class DeploymentInfo(_BaseModel):
     """Information about a complete deployment."""
 
     site_id: str = Field(..., description="Site identifier")
@@ -189,15 +189,10 @@ class DeploymentInfo(BaseModel):
         default_factory=list, description="Associated custom domains"
     )
 
-    deployed_at: datetime = Field(..., description="Deployment timestamp")
-
-    @field_serializer("deployed_at")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-
-        return dt.isoformat() if dt else None
+    deployed_at: IsoDateTime = Field(..., description="Deployment timestamp")
 
 
-class FileUploadResult(BaseModel):
+class FileUploadResult(_BaseModel):
     """Result of file upload operation."""
 
     total_file_count: int = Field(..., description="Total number of files")
@@ -209,7 +204,7 @@ class FileUploadResult(BaseModel):
     upload_url: str | None = Field(None, description="Upload URL used")
 
 
-class DeploymentResult(BaseModel):
+class DeploymentResult(_BaseModel):
     """Result of a complete site deployment."""
 
     version_name: str = Field(..., description="Deployed version name")
@@ -1,15 +1,22 @@
 """Data models for Firestore operations."""
 
-from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_serializer
+from pydantic import ConfigDict, Field, PrivateAttr
+
+from ._common import IsoDateTime, JSONBytesModel
 
 if TYPE_CHECKING:
     from google.cloud.firestore_v1.document import DocumentReference
 
 
+class _BaseModel(JSONBytesModel):
+    """Base for Firestore models; schemas are built on first use, not at import."""
+
+    model_config = ConfigDict(defer_build=True)
+
+
 class QueryOperator(str, Enum):
     """Firestore query operators."""
 
@@ -25,15 +32,17 @@ class QueryOperator(str, Enum):
     NOT_IN = "not_in"
 
 
-class FirestoreQuery(BaseModel):
+class FirestoreQuery(_BaseModel):
     """Query parameters for Firestore."""
 
     field: str = Field(..., description="Field name to query")
     operator: QueryOperator = Field(..., description="Query operator")
     value: Any = Field(..., description="Value to compare against")
 
+    model_config = ConfigDict(frozen=True)
 
-class FirestoreDocument(BaseModel):
+
+class FirestoreDocument(_BaseModel):
     """
     Represents a Firestore document with native object binding.
 
@@ -44,18 +53,12 @@ class FirestoreDocument(BaseModel):
     id: str = Field(..., description="Document ID")
     collection: str = Field(..., description="Collection path")
     data: dict[str, Any] = Field(..., description="Document data")
-    create_time: datetime | None = Field(None, description="Document creation time")
-    update_time: datetime | None = Field(None, description="Last update time")
+    create_time: IsoDateTime | None = Field(None, description="Document creation time")
+    update_time: IsoDateTime | None = Field(None, description="Last update time")
 
     # Private attribute for native Firestore DocumentReference
     _firestore_ref: Optional["DocumentReference"] = PrivateAttr(default=None)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
-    @field_serializer("create_time", "update_time")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-        return dt.isoformat() if dt else None
-
     def update(self, updates: dict[str, Any]) -> None:
         """
         Update document fields.
@@ -131,6 +134,9 @@ class FirestoreDocument(BaseModel):
         Example:
             ```python
             doc.set({"name": "John", "age": 30}, merge=True)
+
+            # Send only the fields set on a partial pydantic model
+            doc.set(profile.model_dump(exclude_unset=True), merge=True)
             ```
         """
         if not self._firestore_ref:
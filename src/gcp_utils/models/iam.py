@@ -1,10 +1,17 @@
 """Data models for IAM (Identity and Access Management) operations."""
 
-from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer
+from pydantic import ConfigDict, Field, TypeAdapter
+
+from ._common import InternedStr, IsoDateTime, JSONBytesModel
+
+
+class _BaseModel(JSONBytesModel):
+    """Base for IAM models; schemas are built on first use."""
+
+    model_config = ConfigDict(defer_build=True)
 
 
 class ServiceAccountKeyAlgorithm(str, Enum):
@@ -23,7 +30,7 @@ class ServiceAccountKeyType(str, Enum):
     SYSTEM_MANAGED = "SYSTEM_MANAGED"
 
 
-class ServiceAccountKey(BaseModel):
+class ServiceAccountKey(_BaseModel):
     """
     Represents a service account key.
 
@@ -48,10 +55,10 @@ class ServiceAccountKey(BaseModel):
         default=None, description="Private key data (base64 encoded)"
     )
     public_key_data: str | None = Field(default=None, description="Public key data")
-    valid_after_time: datetime | None = Field(
+    valid_after_time: IsoDateTime | None = Field(
         default=None, description="Key valid after time"
     )
-    valid_before_time: datetime | None = Field(
+    valid_before_time: IsoDateTime | None = Field(
         default=None, description="Key valid before time"
     )
     key_origin: str | None = Field(default=None, description="Key origin")
@@ -59,12 +66,8 @@ class ServiceAccountKey(BaseModel):
 
     model_config = ConfigDict(use_enum_values=True)
 
-    @field_serializer("valid_after_time", "valid_before_time")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-        return dt.isoformat() if dt else None
-
 
-class ServiceAccount(BaseModel):
+class ServiceAccount(_BaseModel):
     """
     Represents a GCP service account.
 
@@ -89,26 +92,52 @@ class ServiceAccount(BaseModel):
     disabled: bool = Field(default=False, description="Whether disabled")
 
 
-class IAMBinding(BaseModel):
+class IAMCondition(_BaseModel):
+    """
+    Represents a condition on a conditional IAM role binding.
+
+    Attributes:
+        expression: CEL expression that must evaluate to true
+        title: Short title for the condition
+        description: Longer description of the condition
+        location: Where the expression came from, for error reporting
+    """
+
+    expression: str = Field(..., description="CEL expression")
+    title: str | None = Field(default=None, description="Condition title")
+    description: str | None = Field(default=None, description="Condition description")
+    location: str | None = Field(default=None, description="Expression location")
+
+    model_config = ConfigDict(frozen=True)
+
+
+class IAMBinding(_BaseModel):
     """
     Represents an IAM policy binding.
 
     Attributes:
         role: Role identifier (e.g., 'roles/storage.admin')
-        members: List of members (e.g., 'user:email@example.com', 'serviceAccount:sa@project.iam.gserviceaccount.com')
+        members: Tuple of members (e.g., 'user:email@example.com', 'serviceAccount:sa@project.iam.gserviceaccount.com')
         condition: Optional condition for conditional role bindings
     """
 
-    role: str = Field(..., description="IAM role")
-    members: list[str] = Field(
-        default_factory=list, description="List of member identifiers"
+    role: InternedStr = Field(..., description="IAM role")
+    members: tuple[str, ...] = Field(
+        default_factory=tuple, description="Member identifiers"
     )
-    condition: dict[str, Any] | None = Field(
+    condition: IAMCondition | None = Field(
         default=None, description="Optional IAM condition"
     )
 
+    model_config = ConfigDict(frozen=True)
+
+
+_BINDING_LIST_ADAPTER = TypeAdapter(
+    list[IAMBinding], config=ConfigDict(defer_build=True)
+)
 
-class IAMPolicy(BaseModel):
+
+class IAMPolicy(_BaseModel):
     """
     Represents an IAM policy.
 
@@ -116,6 +145,9 @@ class IAMPolicy(BaseModel):
         version: Policy version (should be 1 or 3 for conditional policies)
         bindings: List of role bindings
         etag: ETag for concurrency control
+
+    The policy is frozen, but ``bindings`` stays a list so callers can
+    append to it before ``set_iam_policy()``.
     """
 
     version: int = Field(default=1, description="Policy version")
@@ -124,8 +156,24 @@ class IAMPolicy(BaseModel):
     )
     etag: str | None = Field(None, description="ETag for concurrency control")
 
+    model_config = ConfigDict(frozen=True)
+
+    @classmethod
+    def from_api(cls, raw: dict[str, Any]) -> "IAMPolicy":
+        """
+        Validate a policy from a ``getIamPolicy`` API payload.
+
+        The whole ``bindings`` list is validated in a single call to a cached
+        validator rather than one ``IAMBinding.model_validate()`` per item.
+        """
+        return cls.model_construct(
+            version=raw.get("version", 1),
+            bindings=_BINDING_LIST_ADAPTER.validate_python(raw.get("bindings", [])),
+            etag=raw.get("etag"),
+        )
+
 
-class ServiceAccountInfo(BaseModel):
+class ServiceAccountInfo(_BaseModel):
     """
     Extended service account information with statistics.
 
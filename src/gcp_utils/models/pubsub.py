@@ -2,13 +2,21 @@
 
 from typing import TYPE_CHECKING, Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from pydantic import ConfigDict, Field, PrivateAttr
+
+from ._common import InternedStr, JSONBytesModel
 
 if TYPE_CHECKING:
     from google.cloud.pubsub_v1.types import Subscription, Topic
 
 
-class TopicInfo(BaseModel):
+class _BaseModel(JSONBytesModel):
+    """Base for Pub/Sub models; schemas are built on first use."""
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class TopicInfo(_BaseModel):
     """
     Information about a Pub/Sub topic with native object binding.
 
@@ -29,13 +37,13 @@ class TopicInfo(BaseModel):
 
     name: str = Field(..., description="Topic name (without prefix)")
     full_name: str = Field(..., description="Full topic path")
-    labels: dict[str, str] = Field(default_factory=dict, description="Topic labels")
+    labels: dict[InternedStr, InternedStr] = Field(
+        default_factory=dict, description="Topic labels"
+    )
 
     # The actual Topic object (private attribute, not serialized)
     _topic_object: Optional["Topic"] = PrivateAttr(default=None)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
     # Convenience methods that delegate to controller operations
 
     def publish(
@@ -84,7 +92,7 @@ class TopicInfo(BaseModel):
         )
 
 
-class SubscriptionInfo(BaseModel):
+class SubscriptionInfo(_BaseModel):
     """
     Information about a Pub/Sub subscription with native object binding.
 
@@ -118,8 +126,6 @@ class SubscriptionInfo(BaseModel):
     # The actual Subscription object (private attribute, not serialized)
     _subscription_object: Optional["Subscription"] = PrivateAttr(default=None)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
     # Convenience methods that delegate to controller operations
 
     def pull(self, max_messages: int = 10) -> list[dict[str, Any]]:
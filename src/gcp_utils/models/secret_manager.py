@@ -1,15 +1,22 @@
 """Data models for Secret Manager operations."""
 
-from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_serializer
+from pydantic import ConfigDict, Field, PrivateAttr
+
+from ._common import InternedStr, IsoDateTime, JSONBytesModel
 
 if TYPE_CHECKING:
     from google.cloud.secretmanager_v1 import Secret, SecretVersion
 
 
+class _BaseModel(JSONBytesModel):
+    """Base for Secret Manager models; schemas are built on first use."""
+
+    model_config = ConfigDict(defer_build=True)
+
+
 class SecretState(str, Enum):
     """Secret version states."""
 
@@ -19,7 +26,7 @@ class SecretState(str, Enum):
     DESTROYED = "DESTROYED"
 
 
-class SecretInfo(BaseModel):
+class SecretInfo(_BaseModel):
     """
     Information about a Secret Manager secret.
 
@@ -40,18 +47,14 @@ class SecretInfo(BaseModel):
 
     name: str = Field(..., description="Secret name (without prefix)")
     full_name: str = Field(..., description="Full resource name")
-    labels: dict[str, str] = Field(default_factory=dict, description="Secret labels")
-    created: datetime | None = Field(None, description="Creation timestamp")
+    labels: dict[InternedStr, InternedStr] = Field(
+        default_factory=dict, description="Secret labels"
+    )
+    created: IsoDateTime | None = Field(None, description="Creation timestamp")
 
     # The actual Secret object (private attribute, not serialized)
     _secret_object: Optional["Secret"] = PrivateAttr(default=None)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
-    @field_serializer("created")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-        return dt.isoformat() if dt else None
-
     # Convenience methods that delegate to the Secret object
 
     def delete(self) -> None:
@@ -75,7 +78,7 @@ class SecretInfo(BaseModel):
         )
 
 
-class SecretVersionInfo(BaseModel):
+class SecretVersionInfo(_BaseModel):
     """
     Information about a Secret Manager secret version.
 
@@ -99,18 +102,12 @@ class SecretVersionInfo(BaseModel):
     name: str = Field(..., description="Version ID")
     full_name: str = Field(..., description="Full resource name")
     state: str = Field(..., description="Version state (ENABLED, DISABLED, DESTROYED)")
-    created: datetime | None = Field(None, description="Creation timestamp")
-    destroyed: datetime | None = Field(None, description="Destruction timestamp")
+    created: IsoDateTime | None = Field(None, description="Creation timestamp")
+    destroyed: IsoDateTime | None = Field(None, description="Destruction timestamp")
 
     # The actual SecretVersion object (private attribute, not serialized)
     _version_object: Optional["SecretVersion"] = PrivateAttr(default=None)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
-    @field_serializer("created", "destroyed")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-        return dt.isoformat() if dt else None
-
     # Convenience methods that delegate to the SecretVersion object
 
     def access_version(self) -> bytes:
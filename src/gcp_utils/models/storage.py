@@ -1,12 +1,27 @@
 """Data models for Cloud Storage operations."""
 
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Optional
+from collections.abc import Iterable
+from datetime import timedelta
+from itertools import batched
+from typing import TYPE_CHECKING, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from ._common import IsoDateTime
 
 if TYPE_CHECKING:
-    from google.cloud.storage import Blob, Bucket
+    from google.cloud.storage import Blob, Bucket, Client
+
+# Calls per Cloud Storage JSON API batch request
+_DELETE_BATCH_SIZE = 100
+
+
+def _delete_blobs_in_batches(client: "Client", blobs: Iterable["Blob"]) -> None:
+    """Delete blobs, sending up to 100 deletes per batch request."""
+    for chunk in batched(blobs, _DELETE_BATCH_SIZE):
+        with client.batch():
+            for blob in chunk:
+                blob.delete()
 
 
 class BlobMetadata(BaseModel):
@@ -36,8 +51,8 @@ class BlobMetadata(BaseModel):
     size: int = Field(..., description="Size in bytes")
     content_type: str | None = Field(None, description="Content type")
     md5_hash: str | None = Field(None, description="MD5 hash")
-    created: datetime | None = Field(None, description="Creation timestamp")
-    updated: datetime | None = Field(None, description="Last update timestamp")
+    created: IsoDateTime | None = Field(None, description="Creation timestamp")
+    updated: IsoDateTime | None = Field(None, description="Last update timestamp")
     generation: int | None = Field(None, description="Object generation number")
     metageneration: int | None = Field(None, description="Metadata generation number")
     public_url: str | None = Field(
@@ -52,10 +67,6 @@ class BlobMetadata(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    @field_serializer("created", "updated")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-        return dt.isoformat() if dt else None
-
     # Convenience methods that delegate to the GCS object
 
     def reload(self) -> None:
@@ -264,7 +275,7 @@ class BucketInfo(BaseModel):
     storage_class: str = Field(
         ..., description="Storage class (STANDARD, NEARLINE, etc.)"
     )
-    created: datetime | None = Field(None, description="Creation timestamp")
+    created: IsoDateTime | None = Field(None, description="Creation timestamp")
     versioning_enabled: bool = Field(
         default=False, description="Whether versioning is enabled"
     )
@@ -275,10 +286,6 @@ class BucketInfo(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    @field_serializer("created")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-        return dt.isoformat() if dt else None
-
     # Convenience methods that delegate to the GCS object
 
     def reload(self) -> None:
@@ -353,9 +360,9 @@ class BucketInfo(BaseModel):
 
         if force:
             # Delete all blobs first
-            blobs = self._gcs_object.list_blobs()
-            for blob in blobs:
-                blob.delete()
+            _delete_blobs_in_batches(
+                self._gcs_object.client, self._gcs_object.list_blobs()
+            )
 
         self._gcs_object.delete()
 
@@ -1,10 +1,12 @@
 """Data models for Cloud Tasks operations."""
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_serializer
 
+from ._common import IsoDateTime
+
 if TYPE_CHECKING:
     from google.cloud.tasks_v2 import Task
 
@@ -12,13 +14,11 @@ if TYPE_CHECKING:
 class TaskSchedule(BaseModel):
     """Schedule configuration for a Cloud Task."""
 
-    schedule_time: datetime | None = Field(None, description="When to execute the task")
+    schedule_time: IsoDateTime | None = Field(
+        None, description="When to execute the task"
+    )
     delay: timedelta | None = Field(None, description="Delay before execution")
 
-    @field_serializer("schedule_time")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-        return dt.isoformat() if dt else None
-
     @field_serializer("delay")
     def serialize_td(self, td: timedelta | None, _info: Any) -> float | None:
         return td.total_seconds() if td else None
@@ -33,12 +33,10 @@ class CloudTask(BaseModel):
     url: str = Field(..., description="Target URL")
     headers: dict[str, str] = Field(default_factory=dict, description="HTTP headers")
     body: bytes | str | None = Field(None, description="Request body")
-    schedule_time: datetime | None = Field(None, description="Scheduled execution time")
-    created: datetime | None = Field(None, description="Task creation time")
-
-    @field_serializer("schedule_time", "created")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-        return dt.isoformat() if dt else None
+    schedule_time: IsoDateTime | None = Field(
+        None, description="Scheduled execution time"
+    )
+    created: IsoDateTime | None = Field(None, description="Task creation time")
 
 
 class TaskInfo(BaseModel):
@@ -63,7 +61,9 @@ class TaskInfo(BaseModel):
     name: str = Field(..., description="Full task name/path")
     task_id: str = Field(..., description="Task ID")
     queue_name: str = Field(..., description="Queue name")
-    schedule_time: datetime | None = Field(None, description="Scheduled execution time")
+    schedule_time: IsoDateTime | None = Field(
+        None, description="Scheduled execution time"
+    )
     dispatch_count: int = Field(default=0, description="Number of dispatch attempts")
     response_count: int = Field(default=0, description="Number of responses received")
 
@@ -72,10 +72,6 @@ class TaskInfo(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    @field_serializer("schedule_time")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-        return dt.isoformat() if dt else None
-
     # Convenience methods that delegate to controller operations
 
     def delete(self) -> None:
@@ -1,10 +1,11 @@
 """Data models for Workflows operations."""
 
-from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from ._common import IsoDateTime
 
 if TYPE_CHECKING:
     from google.cloud.workflows.executions_v1 import Execution
@@ -43,8 +44,8 @@ class WorkflowInfo(BaseModel):
     name: str = Field(..., description="Workflow name")
     description: str | None = Field(None, description="Workflow description")
     state: str = Field(..., description="Workflow state (ACTIVE, etc.)")
-    created: datetime | None = Field(None, description="Creation timestamp")
-    updated: datetime | None = Field(None, description="Last update timestamp")
+    created: IsoDateTime | None = Field(None, description="Creation timestamp")
+    updated: IsoDateTime | None = Field(None, description="Last update timestamp")
     revision_id: str | None = Field(None, description="Current revision ID")
     labels: dict[str, str] = Field(default_factory=dict, description="Workflow labels")
 
@@ -53,10 +54,6 @@ class WorkflowInfo(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    @field_serializer("created", "updated")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-        return dt.isoformat() if dt else None
-
     # Convenience methods that delegate to controller operations
 
     def execute(self, argument: dict[str, Any] | None = None) -> "WorkflowExecution":
@@ -133,18 +130,14 @@ class WorkflowExecution(BaseModel):
     )
     result: dict[str, Any] | None = Field(None, description="Execution result")
     error: str | None = Field(None, description="Error message if failed")
-    start_time: datetime | None = Field(None, description="Execution start time")
-    end_time: datetime | None = Field(None, description="Execution end time")
+    start_time: IsoDateTime | None = Field(None, description="Execution start time")
+    end_time: IsoDateTime | None = Field(None, description="Execution end time")
 
     # The actual Execution object (private attribute, not serialized)
     _execution_object: Optional["Execution"] = PrivateAttr(default=None)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    @field_serializer("start_time", "end_time")
-    def serialize_dt(self, dt: datetime | None, _info: Any) -> str | None:
-        return dt.isoformat() if dt else None
-
     # Convenience methods that delegate to controller operations
 
     def cancel(self) -> None:
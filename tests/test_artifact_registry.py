@@ -2,6 +2,7 @@
 Tests for ArtifactRegistryController.
 """
 
+import gc
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -10,6 +11,7 @@ import pytest
 from gcp_utils.config import GCPSettings
 from gcp_utils.controllers.artifact_registry import ArtifactRegistryController
 from gcp_utils.exceptions import ResourceNotFoundError
+from gcp_utils.models.artifact_registry import RepositoryFormat
 
 
 def create_mock_repository(name: str = "test-repo", format_type: str = "DOCKER"):
@@ -58,6 +60,7 @@ def test_create_repository_success(artifact_registry_controller):
 
     assert "test-repo" in repository.name
     assert repository.format == "DOCKER"
+    assert repository.format is RepositoryFormat.DOCKER
     assert repository.description == "Test repository description"
 
 
@@ -73,6 +76,19 @@ def test_get_repository_success(artifact_registry_controller):
     assert repository.description == "Test repository description"
 
 
+def test_get_repository_keeps_native_binding(artifact_registry_controller):
+    """Test the returned model keeps its native object after conversion."""
+    mock_repository = create_mock_repository("test-repo")
+    artifact_registry_controller._client.get_repository.return_value = mock_repository
+
+    repository = artifact_registry_controller.get_repository("test-repo", "us-central1")
+    artifact_registry_controller._client.get_repository.return_value = None
+    del mock_repository
+    gc.collect()
+
+    assert repository._repository_object is not None
+
+
 def test_get_repository_not_found(artifact_registry_controller):
     """Test getting a non-existent repository."""
     from google.api_core.exceptions import NotFound
@@ -120,3 +136,18 @@ def test_list_repositories(artifact_registry_controller):
     assert "test-repo" in repositories[0].name
     assert repositories[0].repository_id == "test-repo"
     assert repositories[0].description == "Test repository description"
+
+
+def test_controller_import_defers_client_library():
+    """Test importing the controller does not load the generated client."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, gcp_utils.controllers.artifact_registry; "
+        "print('google.cloud.artifactregistry_v1' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
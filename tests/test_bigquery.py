@@ -245,7 +245,7 @@ def test_query(controller: BigQueryController, mock_client: Mock) -> None:
     # Assert
     assert result.total_rows == 2
     assert len(result.rows) == 2
-    assert result.rows[0].values["name"] == "Alice"
+    assert result.rows[0]["name"] == "Alice"
     mock_client.query.assert_called_once()
 
 
@@ -280,3 +280,190 @@ def test_insert_rows_with_errors(
     rows = [{"id": 1, "name": "Alice"}]
     with pytest.raises(BigQueryError):
         controller.insert_rows("my_dataset", "my_table", rows)
+
+
+def test_response_models_are_frozen() -> None:
+    """Test BigQuery response models reject mutation after construction."""
+    from pydantic import ValidationError as PydanticValidationError
+
+    from gcp_utils.models.bigquery import Table
+
+    table = Table(table_id="my_table", dataset_id="my_dataset", project="p")
+    with pytest.raises(PydanticValidationError):
+        table.num_rows = 10  # type: ignore[misc]
+
+
+def test_models_are_built_at_import() -> None:
+    """Test BigQuery models (including self-referencing SchemaField) build eagerly."""
+    from pydantic import BaseModel
+
+    from gcp_utils.models import bigquery as bigquery_models
+
+    for value in vars(bigquery_models).values():
+        if isinstance(value, type) and issubclass(value, BaseModel):
+            if value is not BaseModel:
+                assert value.__pydantic_complete__, value.__name__
+
+
+def test_query_rows_are_not_copied(
+    controller: BigQueryController, mock_client: Mock
+) -> None:
+    """Test query results keep the row dicts built from the client response."""
+    mock_job = MagicMock()
+    mock_job.job_id = "job-456"
+    mock_job.total_bytes_processed = 0
+    mock_job.total_bytes_billed = 0
+    mock_job.cache_hit = True
+    mock_result = MagicMock()
+    mock_result.total_rows = 1
+    mock_result.schema = [bigquery.SchemaField("name", "STRING")]
+    mock_result.__iter__ = Mock(return_value=iter([{"name": "Alice"}]))
+    mock_job.result.return_value = mock_result
+    mock_client.query.return_value = mock_job
+
+    result = controller.query("SELECT name FROM users")
+
+    assert result.rows == [{"name": "Alice"}]
+    assert result.result_schema[0].name == "name"
+    assert result.model_dump(by_alias=True)["schema"][0]["field_type"] == "STRING"
+
+
+def test_list_response_to_json_bytes() -> None:
+    """Test list responses serialize to JSON bytes with aliases and no nulls."""
+    import json
+
+    from gcp_utils.models.bigquery import Table, TableListResponse
+
+    response = TableListResponse(
+        tables=[
+            Table(
+                table_id="my_table",
+                dataset_id="my_dataset",
+                project="p",
+                schema=[SchemaField(name="id", field_type="INTEGER")],
+            )
+        ]
+    )
+    payload = response.to_json_bytes()
+
+    assert isinstance(payload, bytes)
+    data = json.loads(payload)
+    assert "next_page_token" not in data
+    assert data["tables"][0]["schema"][0]["name"] == "id"
+    assert "description" not in data["tables"][0]
+
+
+def test_flat_schema_round_trip() -> None:
+    """Test flattening a nested schema and rebuilding it."""
+    from gcp_utils.models.bigquery import FlatSchema
+
+    schema = [
+        SchemaField(name="id", field_type="INTEGER", mode="REQUIRED"),
+        SchemaField(
+            name="address",
+            field_type="RECORD",
+            fields=[
+                SchemaField(name="street", field_type="STRING"),
+                SchemaField(
+                    name="geo",
+                    field_type="RECORD",
+                    fields=[
+                        SchemaField(name="lat", field_type="FLOAT"),
+                        SchemaField(name="lng", field_type="FLOAT"),
+                    ],
+                ),
+            ],
+        ),
+        SchemaField(name="tags", field_type="STRING", mode="REPEATED"),
+    ]
+
+    flat = FlatSchema.from_tree(schema)
+
+    assert flat.names == ["id", "address", "street", "geo", "lat", "lng", "tags"]
+    assert flat.parent_idx == [-1, -1, 1, 1, 3, 3, -1]
+    assert flat.to_tree() == schema
+
+
+def test_frozen_models_cache_json_bytes() -> None:
+    """Test frozen resources encode once and copies re-encode."""
+    from gcp_utils.models.bigquery import Table
+
+    table = Table(table_id="my_table", dataset_id="my_dataset", project="p")
+    payload = table.to_json_bytes()
+
+    assert table.to_json_bytes() is payload
+    assert table == Table(table_id="my_table", dataset_id="my_dataset", project="p")
+
+    renamed = table.model_copy(update={"table_id": "other_table"})
+    assert b'"other_table"' in renamed.to_json_bytes()
+
+
+def test_table_partitioning_and_clustering() -> None:
+    """Test partitioning/clustering configs validate from API-shaped dicts."""
+    from pydantic import ValidationError as PydanticValidationError
+
+    from gcp_utils.models.bigquery import (
+        Clustering,
+        Table,
+        TimePartitioning,
+        TimePartitioningType,
+    )
+
+    table = Table.model_validate(
+        {
+            "table_id": "events",
+            "dataset_id": "my_dataset",
+            "project": "p",
+            "time_partitioning": {"type": "DAY", "field": "event_date"},
+            "clustering_fields": {"fields": ["user_id"]},
+        }
+    )
+
+    assert table.time_partitioning == TimePartitioning(type="DAY", field="event_date")
+    assert table.time_partitioning.type_ is TimePartitioningType.DAY
+    assert table.clustering_fields == Clustering(fields=["user_id"])
+    assert table.clustering_fields.fields == ["user_id"]
+    data = table.model_dump(by_alias=True)
+    assert data["time_partitioning"]["type"] == TimePartitioningType.DAY
+
+    with pytest.raises(PydanticValidationError):
+        TimePartitioning(type="WEEK")
+    with pytest.raises(PydanticValidationError):
+        table.time_partitioning.field = "other"  # type: ignore[misc]
+
+
+def test_job_list_as_arrays() -> None:
+    """Test the column view of a job listing."""
+    from gcp_utils.models.bigquery import (
+        JOB_STATE_CODES,
+        JOB_TYPE_CODES,
+        Job,
+        JobListResponse,
+        JobState,
+        JobType,
+    )
+
+    response = JobListResponse(
+        jobs=[
+            Job(
+                job_id="a",
+                project="p",
+                state=JobState.DONE,
+                job_type=JobType.QUERY,
+                total_bytes_billed=10,
+            ),
+            Job(job_id="b", project="p", state=JobState.RUNNING),
+            Job(job_id="c", project="p"),
+        ]
+    )
+
+    arrays = response.as_arrays()
+
+    assert arrays.job_ids == ["a", "b", "c"]
+    assert list(arrays.states) == [
+        JOB_STATE_CODES[JobState.DONE],
+        JOB_STATE_CODES[JobState.RUNNING],
+        -1,
+    ]
+    assert list(arrays.job_types) == [JOB_TYPE_CODES[JobType.QUERY], -1, -1]
+    assert list(arrays.total_bytes_billed) == [10, 0, 0]
@@ -247,3 +247,333 @@ def test_run_build_trigger(controller: CloudBuildController, mock_client: Mock)
     # Assert
     assert result.build_id == "build123"
     mock_client.run_build_trigger.assert_called_once()
+
+
+def test_models_defer_schema_build() -> None:
+    """Test Cloud Build models build their schema on first use, not at import."""
+    import subprocess
+    import sys
+
+    code = (
+        "from gcp_utils.models.cloud_build import TriggerListResponse as T; "
+        "print(T.__pydantic_complete__); "
+        "T.model_validate({'triggers': []}); "
+        "print(T.__pydantic_complete__)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "True"]
+
+
+def test_build_list_from_trusted() -> None:
+    """Test constructing list responses from trusted payloads without validation."""
+    from gcp_utils.models.cloud_build import (
+        Build,
+        BuildListResponse,
+        BuildStep,
+        StorageSource,
+    )
+
+    payload = {
+        "builds": [
+            Build(
+                id="build-1",
+                project_id="test-project",
+                steps=[BuildStep(name="gcr.io/cloud-builders/docker")],
+                source={"storage_source": {"bucket": "b", "object": "src.tgz"}},
+            ).model_dump(by_alias=True)
+        ],
+        "next_page_token": "token",
+    }
+
+    response = BuildListResponse.from_trusted(payload)
+
+    build = response.builds[0]
+    assert response.next_page_token == "token"
+    assert isinstance(build.steps[0], BuildStep)
+    assert isinstance(build.source.storage_source, StorageSource)
+    assert build.source.storage_source.object_ == "src.tgz"
+    assert (
+        response.model_dump() == BuildListResponse.model_validate(payload).model_dump()
+    )
+
+
+def test_build_nested_configs_are_typed() -> None:
+    """Test volumes, timing, artifacts and GitHub filters validate to submodels."""
+    from gcp_utils.models.cloud_build import (
+        Build,
+        GitHubEventsConfig,
+        PushFilter,
+        TimeSpan,
+        Volume,
+    )
+
+    payload = {
+        "project_id": "test-project",
+        "steps": [
+            {
+                "name": "gcr.io/cloud-builders/docker",
+                "volumes": [{"name": "cache", "path": "/cache"}],
+            }
+        ],
+        "artifacts": {"images": ["gcr.io/p/app"], "maven_artifacts": []},
+        "timing": {"BUILD": {"start_time": "2024-01-15T10:30:00Z"}},
+        "secrets": [{"kms_key_name": "key", "secret_env": {"TOKEN": "abc"}}],
+    }
+
+    build = Build.model_validate(payload)
+    trusted = Build.from_trusted(payload)
+
+    for result in (build, trusted):
+        assert isinstance(result.steps[0].volumes[0], Volume)
+        assert isinstance(result.timing["BUILD"], TimeSpan)
+        assert result.artifacts.images == ["gcr.io/p/app"]
+        assert result.secrets[0].secret_env == {"TOKEN": "abc"}
+    assert build.artifacts.model_extra == {"maven_artifacts": []}
+
+    github = GitHubEventsConfig.model_validate({"push": {"branch": "^main$"}})
+    assert github.push == PushFilter(branch="^main$")
+
+
+def test_build_list_from_api() -> None:
+    """Test validating a page of builds in one call."""
+    from pydantic import ValidationError as PydanticValidationError
+
+    from gcp_utils.models.cloud_build import Build, BuildListResponse, BuildStatus
+
+    response = BuildListResponse.from_api(
+        {
+            "builds": [
+                {"id": "b1", "project_id": "p", "status": "SUCCESS", "steps": []},
+                {"id": "b2", "project_id": "p", "steps": []},
+            ],
+            "next_page_token": "",
+        }
+    )
+
+    assert [build.id for build in response.builds] == ["b1", "b2"]
+    assert isinstance(response.builds[0], Build)
+    assert response.builds[0].status is BuildStatus.SUCCESS
+    assert response.next_page_token is None
+
+    with pytest.raises(PydanticValidationError):
+        BuildListResponse.from_api({"builds": [{"id": "b3"}]})
+
+
+def test_decode_build_list() -> None:
+    """Test decoding builds directly from JSON bytes."""
+    from gcp_utils.models.cloud_build import BuildStatus, decode_build_list
+
+    builds = decode_build_list(
+        b'[{"id": "b1", "project_id": "p", "status": "QUEUED", "steps": []}]'
+    )
+
+    assert builds[0].id == "b1"
+    assert builds[0].status is BuildStatus.QUEUED
+
+
+def test_build_durations_are_parsed_once() -> None:
+    """Test duration strings are stored as seconds and re-rendered for the API."""
+    from pydantic import ValidationError as PydanticValidationError
+
+    from gcp_utils.models.cloud_build import Build, BuildStep
+
+    build = Build(
+        project_id="p",
+        steps=[BuildStep(name="gcr.io/cloud-builders/docker", timeout="300s")],
+        queue_ttl="3600s",
+    )
+
+    assert build.timeout_s == 600
+    assert build.queue_ttl_s == 3600
+    assert build.steps[0].timeout_s == 300
+    data = build.model_dump()
+    assert data["timeout"] == "600s"
+    assert data["steps"][0]["timeout"] == "300s"
+    assert Build.model_validate(data) == build
+
+    with pytest.raises(PydanticValidationError):
+        BuildStep(name="gcr.io/cloud-builders/docker", timeout="5m")
+
+
+def test_build_from_trusted_parses_api_durations() -> None:
+    """Test from_trusted parses durations from a camelCase API payload."""
+    from gcp_utils.models.cloud_build import Build
+
+    payload = {
+        "id": "b1",
+        "projectId": "p",
+        "timeout": "600s",
+        "queueTtl": "3600s",
+        "steps": [
+            {"name": "gcr.io/x", "args": ["a"], "timeout": "300s", "waitFor": ["-"]}
+        ],
+    }
+
+    build = Build.from_trusted(payload)
+
+    assert build.timeout_s == 600
+    assert build.timeout == "600s"
+    assert build.queue_ttl_s == 3600
+    assert build.queue_ttl == "3600s"
+    assert build.steps[0].timeout_s == 300
+    assert build.steps[0].timeout == "300s"
+    assert build.steps[0].wait_for == ["-"]
+
+
+def test_build_from_trusted_parses_enums_and_timestamps() -> None:
+    """Test from_trusted coerces API status and timestamp strings."""
+    import warnings
+    from datetime import UTC, datetime
+
+    from gcp_utils.models.cloud_build import Build, BuildStatus
+
+    build = Build.from_trusted(
+        {
+            "projectId": "p",
+            "status": "SUCCESS",
+            "createTime": "2024-05-01T12:00:00.123456789Z",
+            "timing": {
+                "BUILD": {
+                    "startTime": "2024-05-01T12:00:00Z",
+                    "endTime": "2024-05-01T12:01:00Z",
+                }
+            },
+            "steps": [{"name": "gcr.io/x"}],
+        }
+    )
+
+    assert build.status is BuildStatus.SUCCESS
+    assert build.create_time == datetime(2024, 5, 1, 12, 0, 0, 123456, tzinfo=UTC)
+    assert build.timing is not None
+    assert build.timing["BUILD"].end_time == datetime(2024, 5, 1, 12, 1, tzinfo=UTC)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        build.model_dump_json()
+
+
+def test_build_options_literal_values() -> None:
+    """Test option sets validate as plain strings and reject unknown values."""
+    from pydantic import ValidationError as PydanticValidationError
+
+    from gcp_utils.models.cloud_build import BuildOptions
+
+    options = BuildOptions(machine_type="E2_MEDIUM", logging="CLOUD_LOGGING_ONLY")
+
+    assert options.machine_type == "E2_MEDIUM"
+    assert type(options.machine_type) is str
+
+    with pytest.raises(PydanticValidationError):
+        BuildOptions(machine_type="E2_HUGE")
+
+
+def test_build_option_constants_match_literals() -> None:
+    """Test each option namespace names exactly the values of its Literal."""
+    from typing import get_args
+
+    from gcp_utils.models import cloud_build
+
+    for name in (
+        "MachineType",
+        "LoggingMode",
+        "LogStreamingOption",
+        "SubstitutionOption",
+    ):
+        namespace = getattr(cloud_build, name)
+        values = {k: v for k, v in vars(namespace).items() if k.isupper()}
+        assert set(values) == set(values.values())
+        assert set(values.values()) == set(get_args(getattr(cloud_build, name + "T")))
+
+    options = cloud_build.BuildOptions(machine_type=cloud_build.MachineType.E2_MEDIUM)
+    assert options.machine_type == "E2_MEDIUM"
+
+
+def test_builds_are_frozen_and_hashable() -> None:
+    """Test equal triggers dedupe in a set and clone() re-hashes."""
+    from pydantic import ValidationError as PydanticValidationError
+
+    from gcp_utils.models.cloud_build import BuildTrigger
+
+    first = BuildTrigger(id="t1", name="deploy", tags=["prod"])
+    duplicate = BuildTrigger(id="t1", name="deploy", tags=["prod"])
+
+    assert len({first, duplicate}) == 1
+    with pytest.raises(PydanticValidationError):
+        first.name = "other"  # type: ignore[misc]
+
+    renamed = first.clone(name="other")
+    assert renamed.name == "other"
+    assert first.name == "deploy"
+    assert hash(renamed) != hash(first)
+
+
+def test_build_hash_ignores_dict_order() -> None:
+    """Test equal builds with reordered substitutions hash the same."""
+    from gcp_utils.models.cloud_build import Build, BuildStep
+
+    steps = [BuildStep(name="gcr.io/cloud-builders/docker")]
+    a = Build(project_id="p", steps=steps, substitutions={"_A": "1", "_B": "2"})
+    b = Build(project_id="p", steps=steps, substitutions={"_B": "2", "_A": "1"})
+
+    assert a == b
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+
+
+def test_build_to_json_bytes_omits_unset_fields() -> None:
+    """Test sparse builds serialize without nulls and with wire aliases."""
+    import json
+
+    from gcp_utils.models.cloud_build import Build, Source, StorageSource
+
+    build = Build(
+        project_id="p",
+        steps=[],
+        source=Source(storage_source=StorageSource(bucket="b", object_="src.tgz")),
+    )
+
+    data = json.loads(build.to_json_bytes())
+
+    assert data["source"] == {"storageSource": {"bucket": "b", "object": "src.tgz"}}
+    assert "status" not in data
+    assert "queueTtl" not in data
+    assert data["timeout"] == "600s"
+
+
+def test_json_schema_is_cached_per_arguments() -> None:
+    """Test JSON schemas are generated once and callers get independent copies."""
+    from gcp_utils.models.cloud_build import BuildTrigger
+
+    first = BuildTrigger.model_json_schema()
+    first["title"] = "Mutated"
+    second = BuildTrigger.model_json_schema()
+
+    assert second["title"] == "BuildTrigger"
+    assert "filter" in second["properties"]
+    assert BuildTrigger.model_json_schema(mode="serialization") != second
+
+
+def test_models_use_camel_case_wire_names() -> None:
+    """Test API-style camelCase payloads validate and serialize back."""
+    from gcp_utils.models.cloud_build import BuildListResponse, BuildTrigger
+
+    trigger = BuildTrigger.model_validate(
+        {
+            "name": "deploy",
+            "github": {"owner": "org", "pullRequest": {"branch": "^main$"}},
+            "ignoredFiles": ["docs/**"],
+            "build": {"projectId": "p", "steps": [], "queueTtl": "60s"},
+        }
+    )
+
+    assert trigger.ignored_files == ["docs/**"]
+    assert trigger.github.pull_request.branch == "^main$"
+    assert trigger.build.queue_ttl_s == 60
+    data = trigger.model_dump(by_alias=True, exclude_none=True)
+    assert data["build"]["projectId"] == "p"
+    assert data["build"]["queueTtl"] == "60s"
+    assert BuildTrigger.model_validate(data) == trigger
+
+    page = BuildListResponse.from_api({"builds": [], "nextPageToken": "next"})
+    assert page.next_page_token == "next"
@@ -13,6 +13,7 @@ from google.cloud.functions_v2.types import Function
 from gcp_utils.config import GCPSettings
 from gcp_utils.controllers.cloud_functions import CloudFunctionsController
 from gcp_utils.exceptions import ResourceNotFoundError
+from gcp_utils.models.cloud_functions import FunctionState
 
 
 @pytest.fixture
@@ -84,6 +85,20 @@ def test_get_function(controller: CloudFunctionsController, mock_client: Mock) -
     mock_client.get_function.assert_called_once()
 
 
+def test_get_function_converts_state(
+    controller: CloudFunctionsController, mock_client: Mock
+) -> None:
+    """Test that the API state is mapped onto the FunctionState enum."""
+    mock_client.get_function.return_value = Function(
+        name="projects/test-project/locations/us-central1/functions/my-function",
+        state=Function.State.ACTIVE,
+    )
+
+    result = controller.get_function("my-function")
+
+    assert result.state is FunctionState.ACTIVE
+
+
 def test_get_function_not_found(
     controller: CloudFunctionsController, mock_client: Mock
 ) -> None:
@@ -211,3 +226,143 @@ def test_get_function_url(
     # Assert
     assert result.startswith("https://")
     assert "my-function" in result
+
+
+def test_function_list_from_api() -> None:
+    """Test validating a page of functions with the cached list validator."""
+    from gcp_utils.models.cloud_functions import FunctionListResponse
+
+    response = FunctionListResponse.from_api(
+        {
+            "functions": [
+                {"name": "projects/p/locations/l/functions/a", "state": "ACTIVE"},
+                {"name": "projects/p/locations/l/functions/b"},
+            ],
+            "nextPageToken": "token-2",
+        }
+    )
+
+    assert [f.name.rsplit("/", 1)[-1] for f in response.functions] == ["a", "b"]
+    assert response.functions[0].state is FunctionState.ACTIVE
+    assert response.next_page_token == "token-2"
+    assert response.unreachable == []
+
+
+def test_function_list_from_api_reads_rest_keys() -> None:
+    """Test multi-word REST keys populate their snake_case fields."""
+    from gcp_utils.models.cloud_functions import FunctionListResponse, Runtime
+
+    response = FunctionListResponse.from_api(
+        {
+            "functions": [
+                {
+                    "name": "projects/p/locations/l/functions/a",
+                    "buildConfig": {"runtime": "python312", "entryPoint": "main"},
+                    "serviceConfig": {
+                        "availableMemory": "512M",
+                        "serviceAccountEmail": "sa@p.iam.gserviceaccount.com",
+                        "secretEnvironmentVariables": [
+                            {"key": "TOKEN", "projectId": "p", "secret": "tok"}
+                        ],
+                    },
+                    "eventTrigger": {
+                        "eventType": "google.cloud.storage.object.v1.finalized",
+                        "triggerRegion": "us-central1",
+                        "eventFilters": [{"attribute": "bucket", "value": "up"}],
+                    },
+                    "updateTime": "2024-05-01T12:00:00Z",
+                }
+            ],
+        }
+    )
+
+    (function,) = response.functions
+    assert function.build_config is not None
+    assert function.build_config.runtime is Runtime.PYTHON_312
+    assert function.build_config.entry_point == "main"
+    assert function.service_config is not None
+    assert function.service_config.memory_bytes == 512 * 10**6
+    assert function.service_config.service_account_email == (
+        "sa@p.iam.gserviceaccount.com"
+    )
+    (secret,) = function.service_config.secret_environment_variables or []
+    assert secret.project_id == "p"
+    assert function.event_trigger is not None
+    assert function.event_trigger.trigger_region == "us-central1"
+    assert function.update_time is not None
+
+
+def test_service_config_resource_quantities() -> None:
+    """Test available_memory/available_cpu are exposed as bytes and millicores."""
+    from gcp_utils.models.cloud_functions import ServiceConfig
+
+    config = ServiceConfig(available_memory="1Gi", available_cpu="0.5")
+    assert config.memory_bytes == 1024**3
+    assert config.cpu_millicores == 500
+    assert ServiceConfig().memory_bytes == 256 * 10**6
+
+    config = ServiceConfig(available_memory="lots")
+    with pytest.raises(ValueError):
+        _ = config.memory_bytes
+
+
+def test_event_filters_are_plain_records() -> None:
+    """Test event filters validate from dicts into lightweight frozen records."""
+    from gcp_utils.models.cloud_functions import EventFilter, EventTrigger
+
+    trigger = EventTrigger(
+        event_type="google.cloud.storage.object.v1.finalized",
+        event_filters=[{"attribute": "bucket", "value": "uploads"}],
+    )
+
+    assert trigger.event_filters == [EventFilter("bucket", "uploads")]
+    assert not hasattr(trigger.event_filters[0], "__dict__")
+    assert trigger.model_dump()["event_filters"] == [
+        {"attribute": "bucket", "value": "uploads", "operator": None}
+    ]
+
+
+def test_function_to_model_interns_configs(
+    controller: CloudFunctionsController,
+) -> None:
+    """Test nested configs are converted and their repeated IDs interned."""
+    import sys
+
+    from google.cloud import functions_v2
+
+    from gcp_utils.models.cloud_functions import EventFilter, IngressSettings
+
+    function = Function(
+        name="projects/test-project/locations/us-central1/functions/f",
+        service_config=functions_v2.ServiceConfig(
+            available_memory="512M",
+            service_account_email="sa@test-project.iam.gserviceaccount.com",
+            ingress_settings=functions_v2.ServiceConfig.IngressSettings.ALLOW_INTERNAL_ONLY,
+            secret_environment_variables=[
+                functions_v2.SecretEnvVar(
+                    key="TOKEN", project_id="test-project", secret="tok"
+                )
+            ],
+        ),
+        event_trigger=functions_v2.EventTrigger(
+            trigger_region="us-central1",
+            event_type="google.cloud.storage.object.v1.finalized",
+            event_filters=[{"attribute": "bucket", "value": "uploads"}],
+        ),
+    )
+
+    result = controller._function_to_model(function)
+
+    assert result.service_config is not None
+    assert result.service_config.memory_bytes == 512 * 10**6
+    assert result.service_config.ingress_settings is IngressSettings.ALLOW_INTERNAL_ONLY
+    assert result.service_config.service_account_email is sys.intern(
+        "sa@test-project.iam.gserviceaccount.com"
+    )
+    (secret,) = result.service_config.secret_environment_variables or []
+    assert secret.project_id is sys.intern("test-project")
+    assert secret.version == "latest"
+    assert result.event_trigger is not None
+    assert result.event_trigger.trigger_region is sys.intern("us-central1")
+    assert result.event_trigger.event_filters == [EventFilter("bucket", "uploads")]
+    assert result.event_trigger.service_account_email is None
@@ -592,3 +592,118 @@ def test_lazy_client_initialization():
         # Now client should be initialized
         assert controller._client is not None
         mock_client_class.assert_called_once()
+
+
+def test_models_defer_schema_build():
+    """Test log models build their schema on first use, not at import."""
+    import subprocess
+    import sys
+
+    code = (
+        "from gcp_utils.models.cloud_logging import LogEntry as E; "
+        "print(E.__pydantic_complete__); "
+        "E(log_name='projects/p/logs/l', resource={}); "
+        "print(E.__pydantic_complete__)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "True"]
+
+
+def test_validate_log_entries():
+    """Test validating a batch of entry payloads with the cached validator."""
+    from gcp_utils.models.cloud_logging import validate_log_entries
+
+    entries = validate_log_entries(
+        [
+            {"log_name": "projects/p/logs/a", "resource": {}, "severity": "ERROR"},
+            {"log_name": "projects/p/logs/b", "resource": {"type": "global"}},
+        ]
+    )
+
+    assert [e.severity for e in entries] == [LogSeverity.ERROR, LogSeverity.DEFAULT]
+    assert entries[1].resource == {"type": "global"}
+
+
+def test_validate_log_entries_reads_rest_keys():
+    """Test REST entries with camelCase keys validate into their fields."""
+    from gcp_utils.models.cloud_logging import validate_log_entries
+
+    (entry,) = validate_log_entries(
+        [
+            {
+                "logName": "projects/p/logs/app",
+                "resource": {"type": "global"},
+                "textPayload": "hello",
+                "insertId": "abc",
+                "receiveTimestamp": "2024-05-01T12:00:00Z",
+                "httpRequest": {"requestMethod": "GET", "latency": "0.25s"},
+                "spanId": "123",
+            }
+        ]
+    )
+
+    assert entry.log_name == "projects/p/logs/app"
+    assert entry.text_payload == "hello"
+    assert entry.insert_id == "abc"
+    assert entry.receive_timestamp is not None
+    assert entry.http_request is not None
+    assert entry.http_request.request_method == "GET"
+    assert entry.http_request.latency == 0.25
+    assert entry.span_id == "123"
+
+
+def test_log_entry_to_dict():
+    """Test to_dict() includes only set fields and flattens submodels."""
+    from gcp_utils.models.cloud_logging import HttpRequestInfo, LogEntry
+
+    entry = LogEntry(
+        log_name="projects/p/logs/l",
+        resource={"type": "global"},
+        severity=LogSeverity.WARNING,
+        json_payload={"message": "hi"},
+        http_request=HttpRequestInfo(request_method="GET", status=200),
+        trace="projects/p/traces/abc",
+    )
+
+    assert entry.to_dict() == {
+        "log_name": "projects/p/logs/l",
+        "resource": {"type": "global"},
+        "severity": "WARNING",
+        "json_payload": {"message": "hi"},
+        "http_request": {"request_method": "GET", "status": 200},
+        "trace": "projects/p/traces/abc",
+    }
+
+
+def test_log_names_are_interned():
+    """Test equal log names from separate payloads share one string object."""
+    from gcp_utils.models.cloud_logging import validate_log_entries
+
+    names = ["".join(["projects/p/logs/", "app"]) for _ in range(2)]
+    assert names[0] is not names[1]
+
+    entries = validate_log_entries([{"log_name": n, "resource": {}} for n in names])
+
+    assert entries[0].log_name is entries[1].log_name
+
+
+def test_log_entry_to_json_bytes():
+    """Test entries serialize straight to compact JSON bytes without None fields."""
+    import json
+
+    from gcp_utils.models.cloud_logging import LogEntry
+
+    entry = LogEntry(log_name="projects/p/logs/l", resource={}, text_payload="started")
+
+    raw = entry.to_json_bytes()
+
+    assert isinstance(raw, bytes)
+    assert json.loads(raw) == {
+        "log_name": "projects/p/logs/l",
+        "resource": {},
+        "severity": "DEFAULT",
+        "labels": {},
+        "text_payload": "started",
+    }
@@ -409,3 +409,66 @@ def test_execution_path_construction(cloud_run_controller, settings):
     path = cloud_run_controller._get_execution_path("my-job", "execution-123")
     expected = f"projects/{settings.project_id}/locations/{settings.cloud_run_region}/jobs/my-job/executions/execution-123"
     assert path == expected
+
+
+def test_job_resource_quantities():
+    """Test cpu/memory strings are exposed as millicores and bytes."""
+    from gcp_utils.models.cloud_run import CloudRunJob
+
+    job = CloudRunJob(
+        name="job", region="us-central1", image="img", cpu="1000m", memory="512Mi"
+    )
+    assert job.cpu_millicores == 1000
+    assert job.memory_bytes == 512 * 1024**2
+
+    job = CloudRunJob(name="job", region="us-central1", image="img", cpu="2")
+    assert job.cpu_millicores == 2000
+    assert job.memory_bytes is None
+
+
+def test_execution_timestamps_dump_as_iso_strings():
+    """Test execution timestamps are dumped as ISO strings and None is kept."""
+    from gcp_utils.models.cloud_run import JobExecution
+
+    execution = JobExecution(
+        name="projects/p/locations/us-central1/jobs/job/executions/exec-1",
+        execution_id="exec-1",
+        job_name="job",
+        region="us-central1",
+        status=ExecutionStatus.SUCCEEDED,
+        created=datetime(2024, 1, 2, 3, 4, 5),
+    )
+
+    data = execution.model_dump()
+    assert data["created"] == "2024-01-02T03:04:05"
+    assert data["completed"] is None
+
+
+def test_aggregate_executions():
+    """Test summing task counters across executions."""
+    from gcp_utils.models.cloud_run import (
+        ExecutionTaskTotals,
+        JobExecution,
+        aggregate_executions,
+    )
+
+    executions = [
+        JobExecution(
+            name=f"projects/p/locations/r/jobs/job/executions/e{i}",
+            execution_id=f"e{i}",
+            job_name="job",
+            region="us-central1",
+            status=ExecutionStatus.SUCCEEDED,
+            task_count=4,
+            succeeded_count=3,
+            failed_count=i,
+        )
+        for i in range(3)
+    ]
+
+    totals = aggregate_executions(executions)
+
+    assert totals == ExecutionTaskTotals(
+        task_count=12, succeeded_count=9, failed_count=3
+    )
+    assert aggregate_executions([]) == ExecutionTaskTotals()
@@ -4,6 +4,7 @@ Tests for Cloud Scheduler controller.
 This module tests the CloudSchedulerController class with mocked GCP clients.
 """
 
+import sys
 from unittest.mock import MagicMock, Mock
 
 import pytest
@@ -12,7 +13,7 @@ from google.cloud.scheduler_v1.types import Job
 
 from gcp_utils.config import GCPSettings
 from gcp_utils.controllers.cloud_scheduler import CloudSchedulerController
-from gcp_utils.exceptions import ResourceNotFoundError
+from gcp_utils.exceptions import ResourceNotFoundError, ValidationError
 
 
 @pytest.fixture
@@ -81,6 +82,32 @@ def test_create_http_job(
     mock_client.create_job.assert_called_once()
 
 
+def test_create_job_rejects_invalid_schedule(
+    controller: CloudSchedulerController, mock_client: Mock
+) -> None:
+    """Test a malformed cron schedule fails before calling the API."""
+    for schedule in ("0 9 * *", "0 9 * * 1\n"):
+        with pytest.raises(ValidationError):
+            controller.create_job(job_id="bad-job", schedule=schedule)
+
+    mock_client.create_job.assert_not_called()
+
+
+def test_create_job_accepts_english_schedule(
+    controller: CloudSchedulerController, mock_client: Mock
+) -> None:
+    """Test English-like schedules are passed through for the API to validate."""
+    mock_client.create_job.return_value = Job(
+        name="projects/test-project/locations/us-central1/jobs/english-job",
+        schedule="every monday 09:00",
+    )
+
+    result = controller.create_job(job_id="english-job", schedule="every monday 09:00")
+
+    assert result.schedule == "every monday 09:00"
+    mock_client.create_job.assert_called_once()
+
+
 def test_create_pubsub_job(
     controller: CloudSchedulerController, mock_client: Mock
 ) -> None:
@@ -122,6 +149,38 @@ def test_get_job(controller: CloudSchedulerController, mock_client: Mock) -> Non
     mock_client.get_job.assert_called_once()
 
 
+def test_get_job_converts_state(
+    controller: CloudSchedulerController, mock_client: Mock
+) -> None:
+    """Test that the proto state is mapped onto the JobState enum."""
+    from gcp_utils.models.cloud_scheduler import JobState
+
+    mock_client.get_job.return_value = Job(
+        name="projects/test-project/locations/us-central1/jobs/my-job",
+        schedule="0 9 * * *",
+        state=Job.State.PAUSED,
+    )
+
+    result = controller.get_job("my-job")
+
+    assert result.state is JobState.PAUSED
+
+
+def test_job_time_zones_are_interned(
+    controller: CloudSchedulerController, mock_client: Mock
+) -> None:
+    """Test that repeated time zone strings share a single object."""
+    mock_client.get_job.return_value = Job(
+        name="projects/test-project/locations/us-central1/jobs/my-job",
+        schedule="0 9 * * *",
+        time_zone="".join(["Europe/", "Berlin"]),
+    )
+
+    result = controller.get_job("my-job")
+
+    assert result.time_zone is sys.intern("Europe/Berlin")
+
+
 def test_get_job_not_found(
     controller: CloudSchedulerController, mock_client: Mock
 ) -> None:
@@ -233,3 +292,110 @@ def test_run_job(controller: CloudSchedulerController, mock_client: Mock) -> Non
     # Assert
     assert result.name.endswith("my-job")
     mock_client.run_job.assert_called_once()
+
+
+def test_models_defer_schema_build() -> None:
+    """Test scheduler models build their schema on first use, not at import."""
+    import subprocess
+    import sys
+
+    code = (
+        "from gcp_utils.models.cloud_scheduler import PubsubTarget as T; "
+        "print(T.__pydantic_complete__); "
+        "T(topic_name='projects/p/topics/t'); "
+        "print(T.__pydantic_complete__)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "True"]
+
+
+def test_job_list_from_api() -> None:
+    """Test validating a page of jobs with the cached list validator."""
+    from gcp_utils.models.cloud_scheduler import JobListResponse, JobState
+
+    response = JobListResponse.from_api(
+        {
+            "jobs": [
+                {"name": "a", "schedule": "0 9 * * 1", "state": "ENABLED"},
+                {"name": "b", "schedule": "*/5 * * * *"},
+            ],
+            "nextPageToken": "token-2",
+        }
+    )
+
+    assert [job.name for job in response.jobs] == ["a", "b"]
+    assert response.jobs[0].state == JobState.ENABLED
+    assert response.next_page_token == "token-2"
+
+
+def test_job_list_from_api_reads_camel_case_keys() -> None:
+    """Test multi-word REST keys populate their snake_case fields."""
+    from gcp_utils.models.cloud_scheduler import HttpMethod, JobListResponse
+
+    response = JobListResponse.from_api(
+        {
+            "jobs": [
+                {
+                    "name": "a",
+                    "schedule": "0 9 * * 1",
+                    "timeZone": "Europe/Berlin",
+                    "httpTarget": {
+                        "uri": "https://example.com/run",
+                        "httpMethod": "POST",
+                        "oidcToken": {"serviceAccountEmail": "sa@p.iam"},
+                    },
+                    "retryConfig": {"retryCount": 3, "maxRetryDuration": "60s"},
+                    "userUpdateTime": "2024-05-01T12:00:00Z",
+                }
+            ]
+        }
+    )
+
+    (job,) = response.jobs
+    assert job.time_zone == "Europe/Berlin"
+    assert job.http_target is not None
+    assert job.http_target.http_method is HttpMethod.POST
+    assert job.http_target.oidc_token is not None
+    assert job.http_target.oidc_token.service_account_email == "sa@p.iam"
+    assert job.retry_config is not None
+    assert job.retry_config.retry_count == 3
+    assert job.user_update_time is not None
+    assert "time_zone" in job.model_dump()
+
+
+def test_job_to_json_bytes_round_trip() -> None:
+    """Test jobs serialize to compact JSON bytes without unset fields."""
+    import json
+
+    from gcp_utils.models.cloud_scheduler import SchedulerJob
+
+    job = SchedulerJob(name="a", schedule="0 9 * * 1", state="ENABLED")
+
+    raw = job.to_json_bytes()
+
+    assert json.loads(raw) == {
+        "name": "a",
+        "schedule": "0 9 * * 1",
+        "time_zone": "America/Los_Angeles",
+        "state": "ENABLED",
+    }
+    assert SchedulerJob.model_validate_json(raw) == job
+
+
+def test_job_validates_schedule_and_time_zone() -> None:
+    """Test the job model rejects bad cron expressions and time zones."""
+    from pydantic import ValidationError as PydanticValidationError
+
+    from gcp_utils.models.cloud_scheduler import SchedulerJob
+
+    with pytest.raises(PydanticValidationError):
+        SchedulerJob(name="a", schedule="0 9 * *")
+
+    assert SchedulerJob(name="a", schedule="every 5 minutes").schedule == (
+        "every 5 minutes"
+    )
+
+    with pytest.raises(PydanticValidationError):
+        SchedulerJob(name="a", schedule="0 9 * * *", time_zone="Mars/Olympus")
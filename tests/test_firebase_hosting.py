@@ -452,3 +452,20 @@ def test_populate_files_success(firebase_hosting_controller):
         import shutil
 
         shutil.rmtree(temp_dir)
+
+
+def test_redirect_rules_are_frozen_and_deduplicate() -> None:
+    """Test redirect rules are immutable value objects usable in sets."""
+    from pydantic import ValidationError as PydanticValidationError
+
+    from gcp_utils.models.firebase_hosting import RedirectRule
+
+    rules = [
+        RedirectRule(source="/old", destination="/new"),
+        RedirectRule(source="/old", destination="/new"),
+        RedirectRule(source="/blog", destination="/news", redirect_type=302),
+    ]
+
+    assert len(set(rules)) == 2
+    with pytest.raises(PydanticValidationError):
+        rules[0].destination = "/other"
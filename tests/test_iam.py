@@ -2,6 +2,7 @@
 Tests for IAMController.
 """
 
+import sys
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -126,3 +127,59 @@ def test_create_service_account_key(iam_controller):
 
     assert key.private_key_data is not None
     assert "key123" in key.name
+
+
+def test_iam_policy_from_api():
+    """Test validating a policy payload with the cached bindings validator."""
+    from gcp_utils.models.iam import IAMPolicy
+
+    policy = IAMPolicy.from_api(
+        {
+            "version": 3,
+            "etag": "BwXyz",
+            "bindings": [
+                {"role": "roles/viewer", "members": ["user:a@example.com"]},
+                {"role": "".join(["roles/", "owner"])},
+            ],
+        }
+    )
+
+    assert policy.version == 3
+    assert policy.etag == "BwXyz"
+    assert [b.role for b in policy.bindings] == ["roles/viewer", "roles/owner"]
+    assert policy.bindings[0].members == ("user:a@example.com",)
+    assert policy.bindings[1].members == ()
+    assert policy.bindings[1].role is sys.intern("roles/owner")
+
+
+def test_iam_policy_conditions_round_trip(iam_controller):
+    """Test that binding conditions are read from and written to the API."""
+    from google.iam.v1 import policy_pb2
+    from google.type import expr_pb2
+
+    condition = expr_pb2.Expr(
+        expression="request.time < timestamp('2030-01-01T00:00:00Z')",
+        title="expires",
+    )
+    iam_controller._client.get_iam_policy.return_value = policy_pb2.Policy(
+        version=3,
+        bindings=[
+            policy_pb2.Binding(
+                role="roles/viewer", members=["user:a@example.com"], condition=condition
+            )
+        ],
+    )
+    iam_controller._client.set_iam_policy.return_value = (
+        iam_controller._client.get_iam_policy.return_value
+    )
+
+    policy = iam_controller.get_iam_policy("projects/test-project")
+    (binding,) = policy.bindings
+
+    assert binding.condition.title == "expires"
+    assert binding.condition.description is None
+
+    iam_controller.set_iam_policy("projects/test-project", policy)
+
+    request = iam_controller._client.set_iam_policy.call_args.kwargs["request"]
+    assert request.policy.bindings[0].condition == condition
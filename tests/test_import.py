@@ -95,3 +95,18 @@ def test_import_models():
     assert CloudRunService is not None
     assert WorkflowExecution is not None
     assert CloudTask is not None
+
+
+def test_import_models_skips_client_libraries():
+    """Test that importing models does not load any Google Cloud client."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, gcp_utils.models; "
+        "print(any(m.startswith('google.cloud') for m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
@@ -3,6 +3,7 @@ Tests for all Pydantic models.
 """
 
 from datetime import datetime
+from unittest.mock import MagicMock
 
 import pytest
 from pydantic import ValidationError
@@ -38,6 +39,14 @@ class TestCloudRunModels:
         with pytest.raises(ValidationError):
             TrafficTarget(percent=150)  # percent > 100
 
+    def test_traffic_target_is_frozen(self):
+        """Test TrafficTarget is immutable and can be shared or deduplicated."""
+        target = TrafficTarget(revision_name="rev-001", percent=100)
+        with pytest.raises(ValidationError):
+            target.percent = 50
+        same = TrafficTarget(revision_name="rev-001", percent=100)
+        assert len({target, same}) == 1
+
     def test_service_revision_creation(self):
         """Test creating a ServiceRevision."""
         revision = ServiceRevision(
@@ -92,6 +101,22 @@ class TestStorageModels:
         assert bucket.location == "us-central1"
         assert bucket.storage_class == "STANDARD"
 
+    def test_bucket_force_delete_batches_blob_deletes(self):
+        """Test force-deleting a bucket deletes blobs in batches of 100."""
+        blobs = [MagicMock() for _ in range(250)]
+        native = MagicMock()
+        native.list_blobs.return_value = iter(blobs)
+        bucket = BucketInfo(
+            name="test-bucket", location="us-central1", storage_class="STANDARD"
+        )
+        bucket._gcs_object = native
+
+        bucket.delete(force=True)
+
+        assert native.client.batch.call_count == 3
+        assert all(blob.delete.call_count == 1 for blob in blobs)
+        native.delete.assert_called_once_with()
+
     def test_blob_metadata_creation(self):
         """Test creating a BlobMetadata."""
         blob = BlobMetadata(
@@ -104,6 +129,17 @@ class TestStorageModels:
         assert blob.size == 1024
         assert blob.content_type == "text/plain"
 
+    def test_blob_metadata_serialization(self):
+        """Test blob timestamps dump as ISO strings."""
+        blob = BlobMetadata(
+            name="test-blob.txt",
+            size=1024,
+            bucket="test-bucket",
+            created=datetime(2024, 5, 1, 12, 30),
+        )
+        assert blob.model_dump()["created"] == "2024-05-01T12:30:00"
+        assert blob.model_dump()["updated"] is None
+
     def test_upload_result_creation(self):
         """Test creating an UploadResult."""
         result = UploadResult(
@@ -126,6 +162,18 @@ class TestFirestoreModels:
         assert doc.collection == "users"
         assert doc.data["name"] == "John"
 
+    def test_firestore_document_serialization(self):
+        """Test document timestamps dump as ISO strings in both modes."""
+        doc = FirestoreDocument(
+            id="doc123",
+            collection="users",
+            data={},
+            create_time=datetime(2024, 5, 1, 12, 30),
+        )
+        assert doc.model_dump()["create_time"] == "2024-05-01T12:30:00"
+        assert doc.model_dump()["update_time"] is None
+        assert '"create_time":"2024-05-01T12:30:00"' in doc.model_dump_json()
+
     def test_firestore_query_creation(self):
         """Test creating a FirestoreQuery."""
         query = FirestoreQuery(
@@ -163,6 +211,21 @@ class TestIAMModels:
         assert binding.role == "roles/viewer"
         assert len(binding.members) == 1
 
+    def test_iam_binding_is_frozen(self):
+        """Test that IAMBinding rejects attribute assignment."""
+        binding = IAMBinding(role="roles/viewer", members=["user:test@example.com"])
+        with pytest.raises(ValidationError):
+            binding.role = "roles/owner"
+
+    def test_iam_policy_is_frozen_but_bindings_can_grow(self):
+        """Test that IAMPolicy is frozen while its bindings list stays editable."""
+        policy = IAMPolicy(etag="abc")
+        with pytest.raises(ValidationError):
+            policy.etag = "def"
+
+        policy.bindings.append(IAMBinding(role="roles/viewer"))
+        assert [b.role for b in policy.bindings] == ["roles/viewer"]
+
     def test_iam_policy_creation(self):
         """Test creating an IAMPolicy."""
         policy = IAMPolicy(
@@ -256,6 +319,38 @@ class TestArtifactRegistryModels:
         assert "test-repo" in repository.name
         assert repository.format == RepositoryFormat.DOCKER
 
+    def test_repository_json_serialization(self):
+        """Test Repository timestamps serialize to ISO 8601 strings in JSON mode."""
+        created = datetime(2024, 1, 15, 10, 30, 0)
+        repository = Repository(
+            name="projects/test-project/locations/us-central1/repositories/test-repo",
+            repository_id="test-repo",
+            format="DOCKER",
+            location="us-central1",
+            create_time=created,
+        )
+        data = repository.model_dump(mode="json")
+        assert data["create_time"] == created.isoformat()
+        assert data["update_time"] is None
+
+    def test_repository_native_binding(self):
+        """Test the native object binding is held per instance, not serialized."""
+
+        class NativeRepository:
+            pass
+
+        repository = Repository(
+            name="projects/test-project/locations/us-central1/repositories/repo",
+            repository_id="repo",
+            format="DOCKER",
+            location="us-central1",
+        )
+        assert repository._repository_object is None
+
+        repository._repository_object = NativeRepository()
+        assert isinstance(repository._repository_object, NativeRepository)
+        assert "_repository_object" not in repository.model_dump()
+
 
 class TestSecretManagerModels:
     """Tests for Secret Manager models."""
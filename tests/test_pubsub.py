@@ -2,6 +2,7 @@
 Tests for PubSubController.
 """
 
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -54,6 +55,21 @@ def test_get_topic_success(pubsub_controller):
     assert topic.name == "test-topic"
 
 
+def test_topic_labels_are_interned(pubsub_controller):
+    """Test that topic label keys and values share interned strings."""
+    mock_topic = MagicMock()
+    mock_topic.name = "projects/test-project/topics/test-topic"
+    mock_topic.labels = {"".join(["te", "am"]): "".join(["pay", "ments"])}
+
+    pubsub_controller._publisher.get_topic.return_value = mock_topic
+
+    topic = pubsub_controller.get_topic("test-topic")
+
+    ((key, value),) = topic.labels.items()
+    assert key is sys.intern("team")
+    assert value is sys.intern("payments")
+
+
 def test_get_topic_not_found(pubsub_controller):
     """Test getting a non-existent topic."""
     pubsub_controller._publisher.get_topic.side_effect = Exception("404 Not Found")
@@ -6,6 +6,7 @@ from unittest.mock import patch
 
 import pytest
 from google.api_core import exceptions as google_exceptions
+from google.cloud.secretmanager_v1 import SecretVersion
 
 from gcp_utils.config import GCPSettings
 from gcp_utils.controllers.secret_manager import SecretManagerController
@@ -49,6 +50,21 @@ def test_create_secret(secret_manager_controller):
     assert call_args.kwargs["request"].secret_id == secret_id
 
 
+def test_list_secret_versions(secret_manager_controller):
+    """Test that listed versions carry their state name and native object."""
+    version = SecretVersion(
+        name="projects/p/secrets/my-secret/versions/3",
+        state=SecretVersion.State.DISABLED,
+    )
+    secret_manager_controller.client.list_secret_versions.return_value = [version]
+
+    (result,) = secret_manager_controller.list_secret_versions("my-secret")
+
+    assert result.name == "3"
+    assert result.state == "DISABLED"
+    assert result._version_object is version
+
+
 @pytest.mark.integration
 def test_secret_lifecycle(settings):
     """Integration test for the full lifecycle of a secret."""
@@ -54,6 +54,20 @@ def test_delete_blob(storage_controller):
     mock_blob.delete.assert_called_once()
 
 
+def test_delete_bucket_force_batches_blob_deletes(storage_controller):
+    """Test force-deleting a bucket sends one batch request per 100 blobs."""
+    mock_bucket = MagicMock()
+    blobs = [MagicMock() for _ in range(250)]
+    mock_bucket.list_blobs.return_value = iter(blobs)
+    storage_controller.client.bucket.return_value = mock_bucket
+
+    storage_controller.delete_bucket("my-bucket", force=True)
+
+    assert storage_controller.client.batch.call_count == 3
+    assert all(blob.delete.call_count == 1 for blob in blobs)
+    mock_bucket.delete.assert_called_once_with()
+
+
 @pytest.mark.integration
 def test_bucket_lifecycle(settings):
     """Integration test for the full lifecycle of a bucket."""